@@ -0,0 +1,68 @@
+"""Compares the layout engine against wrapping tracebacks with textwrap on 100 KB tracebacks, and checks that its
+output stays within Discord's limits.
+
+Run from the repository root with ``python -m benchmarks.layout``."""
+import textwrap
+import timeit
+import traceback
+
+import core
+from core.layout import EMBED_CHARACTER_LIMIT, EMBED_FIELD_LIMIT, FIELD_VALUE_LIMIT, MESSAGE_EMBED_LIMIT
+
+
+def recurse(depth: int) -> None:
+    if depth == 0:
+        raise RuntimeError("x" * 2000)
+    recurse(depth - 1)
+
+
+def get_traceback(size: int) -> tuple[BaseException, str]:
+    try:
+        recurse(200)
+    except RuntimeError as error:
+        formatted_error = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        # repeat the frames until the traceback has the requested size, like a chain of re-raised errors
+        return error, (formatted_error * (size // len(formatted_error) + 1))[:size]
+
+
+def wrap(formatted_error: str) -> list[str]:
+    return textwrap.wrap(formatted_error, 1014, break_long_words=False, break_on_hyphens=False)
+
+
+def check_pages(pages: list[list]) -> None:
+    for page in pages:
+        assert len(page) <= MESSAGE_EMBED_LIMIT
+        assert sum(len(embed) for embed in page) <= EMBED_CHARACTER_LIMIT
+        for embed in page:
+            assert len(embed.fields) <= EMBED_FIELD_LIMIT
+            for embed_field in embed.fields:
+                assert len(embed_field.value) <= FIELD_VALUE_LIMIT
+                assert embed_field.value.count("```") % 2 == 0
+
+
+def main() -> None:
+    error, formatted_error = get_traceback(100_000)
+    fields = core.pack_text(formatted_error, name="Error:", code_language="py")
+    pages = core.paginate_fields(fields, title=type(error).__name__)
+    check_pages(pages)
+    check_pages([[core.get_error_embed(core.ErrorEvent(error, [("Event:", core.code_block("on_message"))]))]])
+    wrapped = wrap(formatted_error)
+    print(f"traceback: {len(formatted_error)} characters")
+    over_limit = sum(len(f"```py\n{chunk}```") > FIELD_VALUE_LIMIT for chunk in wrapped)
+    print(f"textwrap: {len(wrapped)} chunks, {over_limit} over the field limit once put in a code block, "
+          f"all in one embed")
+    print(f"layout: {len(fields)} fields on {len(pages)} messages, all within the limits")
+    timings = {
+        "textwrap.wrap": lambda: wrap(formatted_error),
+        "pack_text": lambda: core.pack_text(formatted_error, name="Error:", code_language="py"),
+        "pack_text + paginate_fields": lambda: core.paginate_fields(
+            core.pack_text(formatted_error, name="Error:", code_language="py"), title=type(error).__name__
+        ),
+    }
+    for name, function in timings.items():
+        timing = min(timeit.repeat(function, number=20, repeat=5)) / 20
+        print(f"{name:<30}{timing * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
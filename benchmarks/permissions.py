@@ -0,0 +1,59 @@
+"""Compares the cached permission rendering against rendering every flag with a new permissions object.
+
+Run from the repository root with ``python -m benchmarks.permissions``."""
+import random
+import timeit
+
+import discord
+
+import core
+
+STAFF_PERMISSIONS = 27813093566
+MEMBER_PERMISSIONS = 655052817217
+
+
+def render_uncached(permissions: discord.Permissions, include: int = 0) -> str:
+    if permissions.administrator:
+        return "- Administrator"
+    return (
+            "\n".join(
+                f"- {k.replace('_', ' ').title()}"
+                for k, v in permissions
+                if v and (not include or getattr(discord.Permissions(include), k))
+            )
+            or "_No permissions_"
+    )
+
+
+def main() -> None:
+    random.seed(0)
+    administrator = discord.Permissions.administrator.flag
+    # a few role combinations shared by many members, like in a real guild
+    values = [random.getrandbits(48) & ~administrator for _ in range(8)]
+    members = [discord.Permissions(random.choice(values)) for _ in range(1000)]
+    for permissions in members:
+        for include in (STAFF_PERMISSIONS, MEMBER_PERMISSIONS):
+            assert render_uncached(permissions, include) == core.render_permissions(permissions.value, include)
+
+    def uncached() -> None:
+        for permissions in members:
+            render_uncached(permissions, STAFF_PERMISSIONS)
+            render_uncached(permissions, MEMBER_PERMISSIONS)
+
+    def cached() -> None:
+        for permissions in members:
+            core.render_permissions(permissions.value, STAFF_PERMISSIONS)
+            core.render_permissions(permissions.value, MEMBER_PERMISSIONS)
+
+    def cold() -> None:
+        core.render_permissions.cache_clear()
+        cached()
+
+    for name, function in (("uncached", uncached), ("cached, cold", cold), ("cached, warm", cached)):
+        timing = min(timeit.repeat(function, number=1, repeat=5)) / len(members) / 2
+        print(f"{name:<14}{timing * 1e6:>8.2f}us per render")
+    print(core.render_permissions.cache_info())
+
+
+if __name__ == "__main__":
+    main()
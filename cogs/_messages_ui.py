@@ -0,0 +1,1037 @@
+import discord
+from discord.ext import commands
+
+import core
+
+
+class MessageModal(discord.ui.Modal):
+    """Modal for receiving the content of a message to send or edit."""
+
+    def __init__(self, channel_or_message: discord.abc.GuildChannel | discord.Message, *args, is_new_message: bool,
+                 initial_content=None, **kwargs):
+        """Initializes the modal.
+
+        Parameters
+        ------------
+        channel_or_message: discord.abc.GuildChannel or discord.Message
+            The channel to send the message in or the message to edit.
+        is_new_message: bool
+            Whether the message is new or not. Decides whether to send or edit the message.
+        initial_content: str
+            The initial content of the message. Defaults to None."""
+        self.is_new_message = is_new_message
+        if self.is_new_message:
+            self.channel = channel_or_message
+        else:
+            self.message = channel_or_message
+            self.channel = self.message.channel
+        self.initial_content = initial_content
+
+        super().__init__(
+            discord.ui.InputText(
+                label="Message Content:",
+                placeholder="Please enter the content of your message here...",
+                style=discord.InputTextStyle.long,
+                max_length=2000,
+                value=self.initial_content
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        content = self.children[0].value
+        # Send message
+        if self.is_new_message:
+            message = await self.channel.send(content)
+            await interaction.response.send_message(embed=core.GreenEmbed(
+                title="Message Send",
+                description=f"[Jump to message]({message.jump_url})"
+            ), ephemeral=True)
+            return
+        # Edit message
+        message = await self.message.edit(content=content)
+        await interaction.response.send_message(embed=core.GreenEmbed(
+            title="Message Edited",
+            description=f"[Jump to message]({message.jump_url})"
+        ), ephemeral=True)
+
+
+class EmbedDraft:
+    """The embed being edited with the embed tool, owned by its view.
+
+    Edits are applied to the draft instead of being read back from the embeds of the preview message. Every edit
+    that changes the embed or the tutorial bumps the version of the draft, so the preview is only sent again when
+    what it shows changed."""
+
+    def __init__(self, embed: discord.Embed, tutorial_embed: core.TutorialEmbed) -> None:
+        """Initializes the draft.
+
+        Parameters
+        ------------
+        embed: discord.Embed
+            The embed to edit.
+        tutorial_embed: core.TutorialEmbed
+            The tutorial embed shown below the embed."""
+        self.embed: discord.Embed = embed
+        self.tutorial_embed: core.TutorialEmbed = tutorial_embed
+        self.tutorial_hidden: bool = False
+        self.version: int = 0
+        self.shown_version: int = 0
+        self.skipped_previews: int = 0
+
+    def set(self, **attributes) -> None:
+        """Sets attributes of the embed, like its title or description.
+
+        Parameters
+        ------------
+        **attributes: Any
+            The attributes to set."""
+        for name, value in attributes.items():
+            if getattr(self.embed, name) != value:
+                setattr(self.embed, name, value)
+                self.version += 1
+
+    def set_color(self, color: discord.Color) -> None:
+        """Sets the color of the embed and the tutorial embed.
+
+        Parameters
+        ------------
+        color: discord.Color
+            The color to set."""
+        if self.embed.colour != color:
+            self.embed.colour = color
+            self.tutorial_embed.colour = color
+            self.version += 1
+
+    def add_field(self, *, name: str, value: str, inline: bool) -> None:
+        """Adds a field to the embed.
+
+        Parameters
+        ------------
+        name: str
+            The name of the field.
+        value: str
+            The value of the field.
+        inline: bool
+            Whether the field is inline."""
+        self.embed.add_field(name=name, value=value, inline=inline)
+        self.version += 1
+
+    def set_field(self, index: int, *, name: str, value: str, inline: bool) -> None:
+        """Sets a field of the embed.
+
+        Parameters
+        ------------
+        index: int
+            The index of the field.
+        name: str
+            The name of the field.
+        value: str
+            The value of the field.
+        inline: bool
+            Whether the field is inline."""
+        field = self.embed.fields[index]
+        if (field.name, field.value, field.inline) != (name, value, inline):
+            self.embed.set_field_at(index, name=name, value=value, inline=inline)
+            self.version += 1
+
+    def remove_field(self, index: int) -> None:
+        """Removes a field from the embed.
+
+        Parameters
+        ------------
+        index: int
+            The index of the field."""
+        self.embed.remove_field(index)
+        self.version += 1
+
+    def set_thumbnail(self, url: str | None) -> None:
+        """Sets the thumbnail of the embed.
+
+        Parameters
+        ------------
+        url: str | None
+            The URL of the thumbnail, or None to remove it."""
+        if (self.embed.thumbnail.url if self.embed.thumbnail else None) != url:
+            self.embed.set_thumbnail(url=url)
+            self.version += 1
+
+    def set_image(self, url: str | None) -> None:
+        """Sets the image of the embed.
+
+        Parameters
+        ------------
+        url: str | None
+            The URL of the image, or None to remove it."""
+        if (self.embed.image.url if self.embed.image else None) != url:
+            self.embed.set_image(url=url)
+            self.version += 1
+
+    def set_footer(self, *, text: str | None, icon_url: str | None) -> None:
+        """Sets the footer of the embed. A footer with an icon but without text gets a blank text.
+
+        Parameters
+        ------------
+        text: str | None
+            The text of the footer.
+        icon_url: str | None
+            The URL of the icon of the footer."""
+        if icon_url and not text:
+            text = "⠀"
+        current = (self.embed.footer.text, self.embed.footer.icon_url) if self.embed.footer else (None, None)
+        if current == (text or None, icon_url or None):
+            return
+        if text:
+            self.embed.set_footer(text=text, icon_url=icon_url)
+        else:
+            self.embed.remove_footer()
+        self.version += 1
+
+    def toggle_author(self, user: discord.abc.User) -> None:
+        """Shows a user as the author of the embed, or hides the author if it is shown.
+
+        Parameters
+        ------------
+        user: discord.abc.User
+            The user to show as the author."""
+        if self.embed.author:
+            self.embed.remove_author()
+        else:
+            self.embed.set_author(name=user.display_name, icon_url=user.display_avatar.url)
+        self.version += 1
+
+    def toggle_timestamp(self) -> None:
+        """Shows the current time as the timestamp of the embed, or hides the timestamp if it is shown."""
+        self.embed.timestamp = None if self.embed.timestamp else discord.utils.utcnow()
+        self.version += 1
+
+    def toggle_tutorial(self) -> None:
+        """Shows or hides the tutorial embed below the embed."""
+        self.tutorial_hidden = not self.tutorial_hidden
+        self.version += 1
+
+    def render(self) -> list[discord.Embed]:
+        """Gets the embeds of the preview."""
+        if self.tutorial_hidden:
+            return [self.embed]
+        return [self.embed, self.tutorial_embed]
+
+    async def show(self, interaction: discord.Interaction) -> None:
+        """Responds to an interaction on the preview, editing the preview only if the draft changed since it was
+        last shown.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction to respond to."""
+        if self.version == self.shown_version:
+            self.skipped_previews += 1
+            await interaction.response.defer()
+            return
+        self.shown_version = self.version
+        await interaction.response.edit_message(embeds=self.render())
+
+    async def show_in(self, ctx: discord.ApplicationContext) -> None:
+        """Edits the preview through the command that opened the embed tool, if the draft changed since it was last
+        shown.
+
+        Parameters
+        ------------
+        ctx: discord.ApplicationContext
+            The context used for command invocation."""
+        if self.version == self.shown_version:
+            self.skipped_previews += 1
+            return
+        self.shown_version = self.version
+        await ctx.edit(embeds=self.render())
+
+
+class EmbedToolView(discord.ui.View):
+    """View for the embed tool."""
+
+    def __init__(self, *args, channel_or_message: discord.abc.GuildChannel | discord.Message, is_new_embed: bool,
+                 user_embed: discord.Embed, tutorial_embed: core.TutorialEmbed, ctx: discord.ApplicationContext,
+                 **kwargs):
+        """Initializes the view.
+
+        Parameters
+        ------------
+        channel_or_message: discord.abc.GuildChannel or discord.Message
+            The channel to send the embed in or the message to edit.
+        is_new_embed: bool
+            Whether the embed is new or not. Decides whether to send or edit the embed.
+        user_embed: discord.Embed
+            The embed to edit.
+        tutorial_embed: core.TutorialEmbed
+            The tutorial embed to show.
+        ctx: discord.ApplicationContext
+            The context used for command invocation."""
+        super().__init__(*args, disable_on_timeout=True, **kwargs)
+        self.is_new_embed: bool = is_new_embed
+        if self.is_new_embed:
+            self.channel: discord.abc.GuildChannel = channel_or_message
+        else:
+            self.message = channel_or_message
+            self.channel = self.message.channel
+        self.draft: EmbedDraft = EmbedDraft(user_embed, tutorial_embed)
+        self.ctx: discord.ApplicationContext = ctx
+        self.canceled_before: bool = False
+
+    @discord.ui.button(label="GENERALﾠ", style=discord.ButtonStyle.blurple, disabled=True, row=0)
+    async def general_row(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        pass
+
+    @discord.ui.button(label="⠀ﾠTitleﾠ⠀", style=discord.ButtonStyle.gray, row=0)
+    async def set_title(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the title button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        await interaction.response.send_modal(TitleModal(title="Set the Embed Title", draft=self.draft))
+
+    @discord.ui.button(label="Description", style=discord.ButtonStyle.gray, row=0)
+    async def set_description(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the description button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        await interaction.response.send_modal(DescriptionModal(title="Set the Embed Description", draft=self.draft))
+
+    @discord.ui.button(label="ﾠ⠀Colorﾠ⠀", style=discord.ButtonStyle.gray, row=0)
+    async def set_color(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the color button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        await interaction.response.send_modal(ColorModal(title="Set the Embed Color", draft=self.draft))
+
+    @discord.ui.button(label="FIELDSﾠﾠﾠ", style=discord.ButtonStyle.blurple, disabled=True, row=1)
+    async def fields_row(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        pass
+
+    @discord.ui.button(label="ﾠﾠﾠAddﾠ⠀", style=discord.ButtonStyle.gray, row=1)
+    async def add_field(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the add field button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        await interaction.response.send_modal(AddFieldModal(title="Add a Field", draft=self.draft))
+
+    @discord.ui.button(label="ﾠRemoveﾠﾠ", style=discord.ButtonStyle.gray, row=1)
+    async def remove_field(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the remove field button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        fields = self.draft.embed.fields
+        if not fields:
+            await interaction.response.send_message(embed=core.RedEmbed(
+                title="Error",
+                description="There are no fields to remove."
+            ), ephemeral=True)
+            return
+        options = []
+        for index, field in enumerate(fields):
+            options.append(discord.SelectOption(label=field.name, description=field.value, value=str(index)))
+        await interaction.response.send_message(embed=core.GreenEmbed(
+            title="Remove a Field",
+            description="Select the field you want to remove."
+        ), view=RemoveFieldView(
+            ctx=self.ctx,
+            draft=self.draft,
+            options=options
+        ), ephemeral=True)
+
+    @discord.ui.button(label="ﾠﾠﾠEditﾠﾠﾠ", style=discord.ButtonStyle.gray, row=1)
+    async def edit_field(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the edit field button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        fields = self.draft.embed.fields
+        if not fields:
+            await interaction.response.send_message(embed=core.RedEmbed(
+                title="Error",
+                description="There are no fields to edit."
+            ), ephemeral=True)
+            return
+        options = []
+        for index, field in enumerate(fields):
+            options.append(discord.SelectOption(label=field.name, description=field.value, value=str(index)))
+        await interaction.response.send_message(embed=core.GreenEmbed(
+            title="Edit a Field",
+            description="Select the field you want to edit."
+        ), view=EditFieldView(
+            ctx=self.ctx,
+            draft=self.draft,
+            options=options
+        ), ephemeral=True)
+
+    @discord.ui.button(label="IMAGESﾠﾠ", style=discord.ButtonStyle.blurple, disabled=True, row=2)
+    async def images_row(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        pass
+
+    @discord.ui.button(label="Thumbnail", style=discord.ButtonStyle.gray, row=2)
+    async def set_thumbnail(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the thumbnail button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        await interaction.response.send_modal(ThumbnailModal(title="Set the Thumbnail", draft=self.draft))
+
+    @discord.ui.button(label="⠀ﾠImage⠀ﾠ", style=discord.ButtonStyle.gray, row=2)
+    async def set_image(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the image button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        await interaction.response.send_modal(ImageModal(title="Set the Image", draft=self.draft))
+
+    @discord.ui.button(label="ﾠﾠFooterﾠﾠ", style=discord.ButtonStyle.gray, row=2)
+    async def set_footer_image(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the footer image button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        await interaction.response.send_modal(FooterImageModal(title="Set the Footer Image", draft=self.draft))
+
+    @discord.ui.button(label="OPTIONSﾠ", style=discord.ButtonStyle.blurple, disabled=True, row=3)
+    async def options_row(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        pass
+
+    @discord.ui.button(label="ﾠAuthorﾠﾠ", style=discord.ButtonStyle.gray, row=3)
+    async def set_author(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the author button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        self.draft.toggle_author(interaction.user)
+        await self.draft.show(interaction)
+
+    @discord.ui.button(label="ﾠﾠFooterﾠﾠ", style=discord.ButtonStyle.gray, row=3)
+    async def set_footer_text(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the footer text button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        await interaction.response.send_modal(FooterTextModal(title="Set the Embed Footer", draft=self.draft))
+
+    @discord.ui.button(label="Timestamp", style=discord.ButtonStyle.gray, row=3)
+    async def set_timestamp(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the timestamp button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        self.draft.toggle_timestamp()
+        await self.draft.show(interaction)
+
+    @discord.ui.button(label="SETTINGS", style=discord.ButtonStyle.blurple, disabled=True, row=4)
+    async def settings_row(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        pass
+
+    @discord.ui.button(label="⠀ﾠSend⠀⠀", style=discord.ButtonStyle.green, row=4)
+    async def send_embed(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the send button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        user_embed = self.draft.embed
+        await interaction.response.defer()
+        if self.is_new_embed:
+            message = await self.channel.send(embed=user_embed)
+            await interaction.followup.send(embed=core.GreenEmbed(
+                title="Embed Send",
+                description=f"[Jump to message]({message.jump_url})"
+            ), ephemeral=True)
+        else:
+            await self.message.edit(embed=user_embed)
+            await interaction.followup.send(embed=core.GreenEmbed(
+                title="Embed Edited",
+                description=f"[Jump to message]({self.message.jump_url})"
+            ), ephemeral=True)
+        await interaction.delete_original_response()
+
+    @discord.ui.button(label="ﾠTutorialﾠﾠ", style=discord.ButtonStyle.gray, row=4)
+    async def show_tutorial(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the tutorial button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        self.draft.toggle_tutorial()
+        await self.draft.show(interaction)
+
+    @discord.ui.button(label="ﾠﾠCancelﾠﾠ", style=discord.ButtonStyle.red, row=4)
+    async def cancel_editing(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        """Callback for the cancel button.
+
+        Parameters
+        ------------
+        button: discord.ui.Button
+            The button that was clicked.
+        interaction: discord.Interaction
+            The interaction that clicked the button."""
+        if self.canceled_before:
+            await interaction.response.defer()
+            await interaction.delete_original_response()
+            return
+        self.canceled_before = True
+        button.label = "ﾠConfirmﾠﾠ"
+        await interaction.response.edit_message(view=self)
+
+
+class TitleModal(discord.ui.Modal):
+    """Modal for receiving the title of an embed to send or edit."""
+
+    def __init__(self, *args, draft: EmbedDraft, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        draft: EmbedDraft
+            The draft of the embed."""
+        self.draft: EmbedDraft = draft
+        super().__init__(
+            discord.ui.InputText(
+                label="Embed Title:",
+                placeholder="Please enter the title of the embed...",
+                style=discord.InputTextStyle.long,
+                max_length=256,
+                value=self.draft.embed.title,
+                required=False
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        self.draft.set(title=self.children[0].value or None)
+        await self.draft.show(interaction)
+
+
+class DescriptionModal(discord.ui.Modal):
+    """Modal for receiving the description of an embed to send or edit."""
+
+    def __init__(self, *args, draft: EmbedDraft, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        draft: EmbedDraft
+            The draft of the embed."""
+        self.draft: EmbedDraft = draft
+        super().__init__(
+            discord.ui.InputText(
+                label="Embed Description:",
+                placeholder="Please enter the description of the embed...",
+                style=discord.InputTextStyle.long,
+                max_length=4000,
+                value=self.draft.embed.description,
+                required=False
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        self.draft.set(description=self.children[0].value or None)
+        await self.draft.show(interaction)
+
+
+class ColorModal(discord.ui.Modal):
+    """Modal for receiving the color of an embed to send or edit."""
+
+    def __init__(self, *args, draft: EmbedDraft, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        draft: EmbedDraft
+            The draft of the embed."""
+        self.draft: EmbedDraft = draft
+        super().__init__(
+            discord.ui.InputText(
+                label="Embed Color:",
+                placeholder="Please enter the HEX code of the color of the embed...",
+                style=discord.InputTextStyle.short,
+                max_length=7,
+                value=str(self.draft.embed.colour) if self.draft.embed.colour is not None else None,
+                required=False
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        color_string = self.children[0].value
+        color = await commands.ColorConverter().convert(interaction, color_string)
+        self.draft.set_color(color)
+        await self.draft.show(interaction)
+
+    async def on_error(self, error: Exception, interaction: discord.Interaction) -> None:
+        """Callback for when the modal has an error.
+
+        Parameters
+        ------------
+        error: Exception
+            The error that occurred.
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        if isinstance(error, commands.BadArgument):
+            await interaction.response.send_message(embed=core.RedEmbed(
+                title="Invalid Color",
+                description="The color you entered is invalid. Please try again using a valid HEX code."
+            ), ephemeral=True)
+            return
+        raise error
+
+
+def parse_inline(inline_str: str) -> bool | None:
+    """Parses the inline input of a field modal.
+
+    Parameters
+    ------------
+    inline_str: str
+        The input of the user.
+
+    Returns
+    -----------
+    bool | None
+        Whether the field is inline, or None if the input is invalid."""
+    inline_str = inline_str.lower()
+    if inline_str in ["true", "1"]:
+        return True
+    if inline_str in ["false", "0"]:
+        return False
+    return None
+
+
+class AddFieldModal(discord.ui.Modal):
+    """Modal for receiving a field to be added to an embed to send or edit."""
+
+    def __init__(self, *args, draft: EmbedDraft, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        draft: EmbedDraft
+            The draft of the embed."""
+        self.draft: EmbedDraft = draft
+        super().__init__(
+            discord.ui.InputText(
+                label="Field Title:",
+                placeholder="Please enter the title of the field...",
+                style=discord.InputTextStyle.long,
+                max_length=256,
+                required=False
+            ),
+            discord.ui.InputText(
+                label="Field Value:",
+                placeholder="Please enter the value of the field...",
+                style=discord.InputTextStyle.long,
+                max_length=1024,
+                required=False
+            ),
+            discord.ui.InputText(
+                label="Inline:",
+                placeholder="Whether the field should be inline (True/False)...",
+                style=discord.InputTextStyle.short,
+                max_length=5,
+                required=True
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        inline = parse_inline(self.children[2].value)
+        if inline is None:
+            await interaction.response.send_message(embed=core.RedEmbed(
+                title="Invalid Inline",
+                description="The inline value you entered is invalid. Please try again using True or False."
+            ), ephemeral=True)
+            return
+        self.draft.add_field(name=self.children[0].value, value=self.children[1].value, inline=inline)
+        await self.draft.show(interaction)
+
+
+class RemoveFieldView(discord.ui.View):
+    """View for removing a field from an embed."""
+
+    def __init__(self, *args, ctx: discord.ApplicationContext, draft: EmbedDraft,
+                 options: list[discord.SelectOption], **kwargs):
+        """Initialize the view.
+
+        Parameters
+        ------------
+        ctx: discord.ApplicationContext
+            The context used for command invocation.
+        draft: EmbedDraft
+            The draft of the embed.
+        options: list[discord.SelectOption]
+            The options to show in the select."""
+        self.ctx: discord.ApplicationContext = ctx
+        self.draft: EmbedDraft = draft
+        super().__init__(*args, **kwargs)
+        self.remove_field.options = options
+
+    @discord.ui.string_select(placeholder="Please select a field to remove...")
+    async def remove_field(self, select: discord.ui.Select, interaction: discord.Interaction) -> None:
+        """Callback for when a field is selected to be removed.
+
+        Parameters
+        ------------
+        select: discord.ui.Select
+            The select that was used to select the field.
+        interaction: discord.Interaction
+            The interaction that selected the field."""
+        await interaction.response.defer()
+        field_index: int = int(select.values[0])
+        if field_index < len(self.draft.embed.fields):
+            self.draft.remove_field(field_index)
+        await self.draft.show_in(self.ctx)
+        await interaction.delete_original_response()
+
+
+class EditFieldView(discord.ui.View):
+    """View for editing a field from an embed."""
+
+    def __init__(self, *args, ctx: discord.ApplicationContext, draft: EmbedDraft,
+                 options: list[discord.SelectOption], **kwargs):
+        """Initialize the view.
+
+        Parameters
+        ------------
+        ctx: discord.ApplicationContext
+            The context used for command invocation.
+        draft: EmbedDraft
+            The draft of the embed.
+        options: list[discord.SelectOption]
+            The options to show in the select."""
+        self.ctx: discord.ApplicationContext = ctx
+        self.draft: EmbedDraft = draft
+        super().__init__(*args, **kwargs)
+        self.edit_field.options = options
+
+    @discord.ui.string_select(placeholder="Please select a field to edit...")
+    async def edit_field(self, select: discord.ui.Select, interaction: discord.Interaction) -> None:
+        """Callback for when a field is selected to be edited.
+
+        Parameters
+        ------------
+        select: discord.ui.Select
+            The select that was used to select the field.
+        interaction: discord.Interaction
+            The interaction that selected the field."""
+        field_index: int = int(select.values[0])
+        if field_index >= len(self.draft.embed.fields):
+            await interaction.response.send_message(embed=core.RedEmbed(
+                title="Error",
+                description="This field no longer exists."
+            ), ephemeral=True)
+            return
+        await interaction.response.send_modal(
+            EditFieldModal(
+                ctx=self.ctx,
+                title="Edit a Field",
+                draft=self.draft,
+                field_index=field_index)
+        )
+        await interaction.delete_original_response()
+
+
+class EditFieldModal(discord.ui.Modal):
+    """Modal for editing a field in an embed."""
+
+    def __init__(self, *args, ctx: discord.ApplicationContext, draft: EmbedDraft, field_index: int, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        ctx: discord.ApplicationContext
+            The context used for command invocation.
+        draft: EmbedDraft
+            The draft of the embed.
+        field_index: int
+            The index of the field to edit."""
+        self.ctx: discord.ApplicationContext = ctx
+        self.draft: EmbedDraft = draft
+        self.field_index: int = field_index
+        field = self.draft.embed.fields[self.field_index]
+        super().__init__(
+            discord.ui.InputText(
+                label="Field Title:",
+                placeholder="Please enter the title of the field...",
+                style=discord.InputTextStyle.long,
+                max_length=256,
+                value=field.name,
+                required=False
+            ),
+            discord.ui.InputText(
+                label="Field Value:",
+                placeholder="Please enter the value of the field...",
+                style=discord.InputTextStyle.long,
+                max_length=1024,
+                value=field.value,
+                required=False
+            ),
+            discord.ui.InputText(
+                label="Inline:",
+                placeholder="Whether the field should be inline (True/False)...",
+                style=discord.InputTextStyle.short,
+                max_length=5,
+                value=str(field.inline),
+                required=True
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        inline = parse_inline(self.children[2].value)
+        if inline is None:
+            await interaction.response.send_message(embed=core.RedEmbed(
+                title="Invalid Inline",
+                description="The inline value you entered is invalid. Please try again using True or False."
+            ), ephemeral=True)
+            return
+        await interaction.response.defer()
+        if self.field_index < len(self.draft.embed.fields):
+            self.draft.set_field(self.field_index, name=self.children[0].value, value=self.children[1].value,
+                                 inline=inline)
+        await self.draft.show_in(self.ctx)
+
+
+class ThumbnailModal(discord.ui.Modal):
+    """Modal for receiving the thumbnail of an embed to send or edit."""
+
+    def __init__(self, *args, draft: EmbedDraft, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        draft: EmbedDraft
+            The draft of the embed."""
+        self.draft: EmbedDraft = draft
+        super().__init__(
+            discord.ui.InputText(
+                label="Thumbnail URL:",
+                placeholder="Please enter Thumbnail URL of the embed...",
+                style=discord.InputTextStyle.long,
+                max_length=4000,
+                value=self.draft.embed.thumbnail.url if self.draft.embed.thumbnail else None,
+                required=False
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        self.draft.set_thumbnail(self.children[0].value or None)
+        await self.draft.show(interaction)
+
+
+class ImageModal(discord.ui.Modal):
+    """Modal for receiving the image of an embed to send or edit."""
+
+    def __init__(self, *args, draft: EmbedDraft, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        draft: EmbedDraft
+            The draft of the embed."""
+        self.draft: EmbedDraft = draft
+        super().__init__(
+            discord.ui.InputText(
+                label="Image URL:",
+                placeholder="Please enter Image URL of the embed...",
+                style=discord.InputTextStyle.long,
+                max_length=4000,
+                value=self.draft.embed.image.url if self.draft.embed.image else None,
+                required=False
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        self.draft.set_image(self.children[0].value or None)
+        await self.draft.show(interaction)
+
+
+class FooterImageModal(discord.ui.Modal):
+    """Modal for receiving the footer image of an embed to send or edit."""
+
+    def __init__(self, *args, draft: EmbedDraft, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        draft: EmbedDraft
+            The draft of the embed."""
+        self.draft: EmbedDraft = draft
+        super().__init__(
+            discord.ui.InputText(
+                label="Footer Image URL:",
+                placeholder="Please enter Footer Image URL of the embed...",
+                style=discord.InputTextStyle.long,
+                max_length=4000,
+                value=self.draft.embed.footer.icon_url if self.draft.embed.footer else None,
+                required=False
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        footer_text = self.draft.embed.footer.text if self.draft.embed.footer else None
+        self.draft.set_footer(text=footer_text, icon_url=self.children[0].value or None)
+        await self.draft.show(interaction)
+
+
+class FooterTextModal(discord.ui.Modal):
+    """Modal for receiving the footer text of an embed to send or edit."""
+
+    def __init__(self, *args, draft: EmbedDraft, **kwargs):
+        """Initialize the modal.
+
+        Parameters
+        ------------
+        draft: EmbedDraft
+            The draft of the embed."""
+        self.draft: EmbedDraft = draft
+        footer_text = self.draft.embed.footer.text if self.draft.embed.footer else None
+        super().__init__(
+            discord.ui.InputText(
+                label="Embed Footer:",
+                placeholder="Please enter the footer of the embed...",
+                style=discord.InputTextStyle.long,
+                max_length=2048,
+                value=footer_text if footer_text != "⠀" else None,
+                required=False
+            ),
+            *args,
+            **kwargs
+        )
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        """Callback for when the modal is submitted.
+
+        Parameters
+        ------------
+        interaction: discord.Interaction
+            The interaction that submitted the modal."""
+        icon_url = self.draft.embed.footer.icon_url if self.draft.embed.footer else None
+        self.draft.set_footer(text=self.children[0].value or None, icon_url=icon_url)
+        await self.draft.show(interaction)
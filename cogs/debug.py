@@ -0,0 +1,109 @@
+import discord
+
+import core
+from core.startup import get_peak_memory
+
+
+class Debug(core.Cog):
+    """Inspect the bot while it is running!"""
+
+    debug_group = discord.SlashCommandGroup(
+        name="debug",
+        description="Group of debug commands!",
+        default_member_permissions=discord.Permissions(administrator=True)
+    )
+
+    @debug_group.command(name="memory", description="Shows the size of the caches of the bot!")
+    async def debug_memory(self, ctx: discord.ApplicationContext):
+        """Command for showing the size of the caches and the top memory allocators.
+
+        Parameters
+        ------------
+        ctx: discord.ApplicationContext
+            The context used for command invocation."""
+        if not await self.check_owner(ctx):
+            return
+
+        fields = []
+        for stats in core.cache_budget.get_stats(self.bot):
+            limit = f" of {stats.limit}" if stats.limit is not None else ""
+            fields.append((stats.name, f"{stats.count}{limit} objects\n~{stats.size / 1024:.1f} KiB"))
+
+        top_allocators = core.cache_budget.get_top_allocators()
+        if top_allocators is None:
+            fields.append(("Top Allocators", "tracemalloc is off, set `tracemalloc_frames` in the config."))
+        else:
+            fields += core.pack_lines(top_allocators, name="Top Allocators", code_language="")
+
+        peak_memory = get_peak_memory()
+        pages = core.paginate_fields(
+            fields,
+            title="Memory",
+            description=f"Peak resident memory: {peak_memory:.1f} MiB" if peak_memory is not None else "",
+            color=discord.Color.blurple(),
+            footer=f"Evicted {core.cache_budget.evicted_threads} threads and {core.cache_budget.evicted_members} "
+                   f"members"
+        )
+        await self.send_pages(ctx, pages)
+
+    @debug_group.command(name="stats", description="Shows the counters of the bot!")
+    async def debug_stats(self, ctx: discord.ApplicationContext):
+        """Command for showing the counters of the event filters and the thread directory writer, and the tag
+        autocomplete latency.
+
+        Parameters
+        ------------
+        ctx: discord.ApplicationContext
+            The context used for command invocation."""
+        if not await self.check_owner(ctx):
+            return
+
+        event_filter_stats = self.bot.get_event_filter_stats()
+        fields = core.pack_lines(
+            [f"{listener}: {passed} passed, {filtered} filtered"
+             for listener, (passed, filtered) in sorted(event_filter_stats.items())] or ["No filtered listeners."],
+            name="Event Filters"
+        )
+        latency = core.tag_store.get_autocomplete_latency()
+        fields.append(("Tag Autocomplete", f"{latency[0]:.2f} ms median, {latency[1]:.2f} ms p95"
+                       if latency is not None else "Nothing has been autocompleted yet."))
+        writer = core.directory_writer
+        fields.append(("Thread Directories", f"{writer.sent_edits} messages written\n"
+                                             f"{writer.coalesced_edits} operations coalesced\n"
+                                             f"{writer.unchanged_pages} unchanged pages skipped"))
+
+        pages = core.paginate_fields(fields, title="Stats", color=discord.Color.blurple())
+        await self.send_pages(ctx, pages)
+
+    async def check_owner(self, ctx: discord.ApplicationContext) -> bool:
+        """Checks whether the author of a command is the owner of the bot, responding with an error if not.
+
+        Parameters
+        ------------
+        ctx: discord.ApplicationContext
+            The context used for command invocation."""
+        if await self.bot.is_owner(ctx.author):
+            return True
+        await ctx.respond(embed=core.RedEmbed(
+            title="Error",
+            description="Only the owner of the bot can use this command."
+        ), ephemeral=True)
+        return False
+
+    @staticmethod
+    async def send_pages(ctx: discord.ApplicationContext, pages: list[list[discord.Embed]]) -> None:
+        """Responds with the first page and sends the other pages as followups.
+
+        Parameters
+        ------------
+        ctx: discord.ApplicationContext
+            The context used for command invocation.
+        pages: list[list[discord.Embed]]
+            The embeds of every page."""
+        await ctx.respond(embeds=pages[0], ephemeral=True)
+        for page in pages[1:]:
+            await ctx.followup.send(embeds=page, ephemeral=True)
+
+
+def setup(bot):
+    bot.add_cog(Debug(bot))
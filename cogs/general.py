@@ -122,8 +122,7 @@ class General(core.Cog):
 
     @commands.slash_command(description="Sends a tag!")
     async def tag(self, ctx: discord.ApplicationContext,
-                  tag: discord.Option(str, "Please enter the tag name!",
-                                      autocomplete=discord.utils.basic_autocomplete(core.get_tag()),
+                  tag: discord.Option(str, "Please enter the tag name!", autocomplete=core.tag_store.autocomplete,
                                       required=True)):
         """Command for sending a tag.
 
@@ -132,28 +131,15 @@ class General(core.Cog):
         ctx: discord.ApplicationContext
             The context used for command invocation.
         tag: str
-            The name of the tag to send. Autocompletes from the tags in config.tags."""
-        tags = core.get_tag()
-        if tag not in tags:
+            The name of the tag to send. Autocompletes from the tags in the tag file."""
+        tag_: core.Tag | None = core.tag_store.get(tag)
+        if tag_ is None:
             await ctx.respond(embed=core.RedEmbed(
                 title="Tag not found",
                 description=f"Tag `{tag}` not found!"
             ), ephemeral=True)
             return
-        image_url: str | None = None
-        lines = tags[tag].split("\r\n")
-        for line in lines:
-            if line.endswith(".png"):
-                image_url = line
-                tags[tag] = tags[tag].replace(line, "")
-                break
-        tag_embed = core.GreenEmbed(
-            title=tag,
-            description=tags[tag]
-        )
-        if image_url:
-            tag_embed.set_image(url=image_url)
-        await ctx.respond(embed=tag_embed)
+        await ctx.respond(embed=tag_.render())
 
 
 def setup(bot):
@@ -14,11 +14,9 @@ class Help(core.Cog):
         ------------
         ctx: discord.ApplicationContext
             The context used for command invocation."""
-        help_embed = core.HelpEmbed(bot=self.bot)
+        help_view = discord.ui.View(core.HelpSelect(self.bot.help_menu))
 
-        help_view = discord.ui.View(core.HelpSelect(self))
-
-        await ctx.respond(embed=help_embed, view=help_view, ephemeral=True)
+        await ctx.respond(embed=self.bot.help_menu.get_embed(), view=help_view, ephemeral=True)
 
 
 def setup(bot):
@@ -14,23 +14,39 @@ class Threads(core.Cog):
         ------------
         thread: discord.Thread
             The thread that was created."""
+        core.thread_owner_index.add(thread)
         if not core.is_valid_thread(thread):
             return
+        label = f"on_thread_create {thread.id}"
+        edits = core.EditBatch()
         if thread.guild.id != core.config.rip_guild_id:
-            await thread.edit(auto_archive_duration=10080)
-            await core.add_members(thread)
+            edits.edit(thread, auto_archive_duration=10080)
+            await core.run_steps(
+                label,
+                core.Step("edit", edits.flush),
+                core.Step("add_members", lambda: core.add_members(thread, auto_archive_duration=10080))
+            )
             return
         if thread.parent_id == core.config.rip_ticket_channel_id:
-            await thread.edit(auto_archive_duration=10080)
-            await core.add_mods(thread)
+            edits.edit(thread, auto_archive_duration=10080)
+            await core.run_steps(
+                label,
+                core.Step("edit", edits.flush),
+                core.Step("add_mods", lambda: core.add_mods(thread, auto_archive_duration=10080))
+            )
             return
         tag_ids = [tag.id for tag in thread.applied_tags]
         if core.config.bell_tag_id in tag_ids:
-            await thread.edit(auto_archive_duration=10080)
-            await core.add_members(thread)
-            await core.add_to_feedback_thread_directory(thread)
+            edits.edit(thread, auto_archive_duration=10080)
+            await core.run_steps(
+                label,
+                core.Step("edit", edits.flush),
+                core.Step("add_members", lambda: core.add_members(thread, auto_archive_duration=10080)),
+                core.Step("directory", lambda: core.add_to_feedback_thread_directory(thread))
+            )
             return
-        await thread.edit(auto_archive_duration=1440)
+        edits.edit(thread, auto_archive_duration=1440)
+        await edits.flush()
 
     @core.Cog.listener()
     async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
@@ -53,17 +69,49 @@ class Threads(core.Cog):
             return
         if before_tag_ids == after_tag_ids:
             return
+        label = f"on_thread_update {after.id}"
+        edits = core.EditBatch()
         if core.config.bell_tag_id in after_tag_ids and core.config.bell_tag_id not in before_tag_ids:
-            await after.unarchive()
-            await after.edit(auto_archive_duration=10080)
-            await core.add_members(after)
-            await core.add_to_feedback_thread_directory(after)
+            # the batch sends unarchiving and the new archive duration as a single request
+            edits.edit(after, archived=False)
+            edits.edit(after, auto_archive_duration=10080)
+            await core.run_steps(
+                label,
+                core.Step("edit", edits.flush),
+                core.Step("add_members", lambda: core.add_members(after), after=("edit",)),
+                core.Step("directory", lambda: core.add_to_feedback_thread_directory(after))
+            )
             return
         if core.config.bell_tag_id not in after_tag_ids and core.config.bell_tag_id in before_tag_ids:
-            await after.edit(auto_archive_duration=1440)
-            await core.remove_from_feedback_thread_directory(after)
+            edits.edit(after, auto_archive_duration=1440)
+            await core.run_steps(
+                label,
+                core.Step("edit", edits.flush),
+                core.Step("directory", lambda: core.remove_from_feedback_thread_directory(after))
+            )
             return
 
+    @core.Cog.listener()
+    async def on_raw_thread_update(self, payload: discord.RawThreadUpdateEvent):
+        """Event for when a thread is updated, even if it isn't cached.
+
+        Parameters
+        ------------
+        payload: discord.RawThreadUpdateEvent
+            The payload for the updated thread."""
+        if payload.thread is not None:
+            core.thread_owner_index.add(payload.thread)
+
+    @core.Cog.listener()
+    async def on_thread_join(self, thread: discord.Thread):
+        """Event for when a thread is joined or becomes visible, for example when it is unarchived.
+
+        Parameters
+        ------------
+        thread: discord.Thread
+            The thread that was joined."""
+        core.thread_owner_index.add(thread)
+
     @core.Cog.listener()
     async def on_thread_delete(self, thread: discord.Thread):
         """Event for when a thread is deleted.
@@ -72,13 +120,26 @@ class Threads(core.Cog):
         ------------
         thread: discord.Thread
             The thread that was deleted."""
-        if not thread.guild.id == core.config.rip_guild_id:
-            return
         if thread.parent_id == core.config.rip_ticket_channel_id:
             return
-        await core.remove_from_feedback_thread_directory(thread)
+        if thread.guild.id == core.config.rip_guild_id:
+            await core.remove_from_feedback_thread_directory(thread)
+            return
+        await core.remove_from_thread_directory(thread)
 
     @core.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        """Event for when a thread is deleted, even if it isn't cached.
+
+        Parameters
+        ------------
+        payload: discord.RawThreadDeleteEvent
+            The payload for the deleted thread."""
+        core.thread_owner_index.remove(payload.guild_id, payload.thread_id)
+
+    @core.Cog.listener()
+    @core.event_filter(guild_ids={core.config.rip_guild_id}, parent_ids={core.config.feedback_channel_id},
+                       exclude_bots=True)
     async def on_message(self, message: discord.Message):
         """Event for when a feedback message is sent.
 
@@ -86,19 +147,59 @@ class Threads(core.Cog):
         ------------
         message: discord.Message
             The message that was sent."""
-        if message.author.bot:
-            return
-        if message.guild.id != core.config.rip_guild_id:
-            return
         if not core.is_valid_thread(message.channel):
             return
-        if message.channel.parent_id != core.config.feedback_channel_id:
-            return
         if not core.is_feedback(message.content):
             return
 
         await core.feedback_received(message)
 
+    @core.Cog.listener()
+    @core.event_filter(channel_ids={channel_id for channel_id, _ in core.config.thread_directories.values()})
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        """Event for when a message is edited.
+
+        Parameters
+        ------------
+        payload: discord.RawMessageUpdateEvent
+            The payload for the edited message."""
+        core.directory_writer.messages.handle_raw_message_edit(payload)
+
+    @core.Cog.listener()
+    @core.event_filter(channel_ids={channel_id for channel_id, _ in core.config.thread_directories.values()})
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """Event for when a message is deleted.
+
+        Parameters
+        ------------
+        payload: discord.RawMessageDeleteEvent
+            The payload for the deleted message."""
+        core.directory_writer.handle_raw_message_delete(payload)
+
+    @core.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        """Event for when a member joins a guild.
+
+        Parameters
+        ------------
+        member: discord.Member
+            The member that joined."""
+        core.role_member_index.handle_member_join(member)
+        core.member_cache.handle_member(member)
+
+    @core.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        """Event for when a member is updated.
+
+        Parameters
+        ------------
+        before: discord.Member
+            The member before the update.
+        after: discord.Member
+            The member after the update."""
+        core.role_member_index.handle_member_update(before, after)
+        core.member_cache.handle_member(after)
+
     @core.Cog.listener()
     async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
         """Event for when a member leaves the guild.
@@ -107,10 +208,12 @@ class Threads(core.Cog):
         ------------
         payload: discord.RawMemberRemoveEvent
             The payload for the member that left."""
+        core.role_member_index.handle_raw_member_remove(payload)
         if payload.guild_id != core.config.rip_guild_id:
             return
-        guild = self.bot.get_guild(payload.guild_id)
-        [await thread.delete() for thread in guild.threads if payload.user.id == thread.owner_id]
+        thread_ids = core.thread_owner_index.pop(payload.guild_id, payload.user.id)
+        if thread_ids:
+            await core.delete_threads(self.bot, thread_ids)
 
     add_group = discord.SlashCommandGroup(
         name="add",
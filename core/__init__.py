@@ -1,34 +1,104 @@
+# imported first, so the startup report measures the import of discord too
+from .startup import *
+
 from discord.ext import commands
 
 from .bot import AimBot
+from .caches import *
 from .config import *
+from .directory import *
+from .edits import *
 from .embeds import *
+from .errors import *
+from .events import *
+from .indexes import *
+from .layout import *
+from .lifecycle import *
+from .members import *
+from .scheduler import *
+from .store import *
+from .sync import *
+from .tags import *
 from .utils import *
 
 __all__ = (
     "add_members",
     "add_mods",
+    "add_thread_members",
     "add_to_feedback_thread_directory",
     "add_to_thread_directory",
     "AimBot",
     "BlurpleEmbed",
     "BugReportEmbed",
+    "cache_budget",
+    "CacheBudget",
+    "CacheStats",
+    "delete_threads",
+    "code_block",
     "Cog",
+    "CommandSyncCache",
+    "current_lane",
+    "directory_index",
+    "directory_writer",
+    "DirectoryEntry",
+    "DirectoryMessageCache",
+    "DirectoryOperation",
+    "DirectoryStore",
+    "EditBatch",
     "Embed",
+    "event_filter",
+    "EventFilter",
     "EmbedToolEmbed",
+    "ErrorEvent",
+    "ErrorReporter",
+    "estimate_size",
     "FeatureRequestEmbed",
+    "fit_fields",
+    "get_command_digest",
+    "get_error_embed",
+    "get_error_fingerprint",
     "get_permissions",
-    "get_tag",
     "get_valid_thread",
     "GreenEmbed",
     "HelpEmbed",
+    "HelpMenu",
     "HelpSelect",
     "HelpSelectEmbed",
     "is_feedback",
+    "is_noop_edit",
     "is_valid_thread",
+    "Lane",
+    "LazyModule",
+    "member_cache",
+    "MemberAddReport",
+    "MemberCachePolicy",
+    "pack_lines",
+    "pack_mentions",
+    "pack_text",
+    "paginate_fields",
+    "reconcile_thread_directories",
     "RedEmbed",
+    "role_member_index",
+    "RoleMemberIndex",
     "remove_from_feedback_thread_directory",
     "remove_from_thread_directory",
+    "render_permissions",
+    "rest_lane",
+    "RestScheduler",
+    "RouteBucket",
+    "run_steps",
+    "startup_report",
+    "StartupReport",
+    "Step",
+    "Tag",
+    "TagIndex",
+    "tag_store",
+    "TagStore",
+    "ThreadDirectoryIndex",
+    "ThreadDirectoryWriter",
+    "thread_owner_index",
+    "ThreadOwnerIndex",
+    "truncate",
     "TutorialEmbed",
     "YellowEmbed"
 )
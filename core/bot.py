@@ -1,8 +1,9 @@
 import os
 import platform
 import sys
-import textwrap
+import time
 import traceback
+import tracemalloc
 
 import discord
 from aiohttp import ClientSession
@@ -12,6 +13,7 @@ import core.config
 
 class AimBot(discord.Bot):
     on_ready_fired: bool = False
+    _cog_setup_time: float = 0.0
 
     def __init__(self):
         super().__init__(
@@ -19,6 +21,9 @@ class AimBot(discord.Bot):
                 f"/help - Version {core.config.version}"
             ),
             help_command=None,
+            chunk_guilds_at_startup=core.member_cache.chunk_at_startup,
+            member_cache_flags=core.member_cache.cache_flags,
+            max_messages=core.cache_budget.max_messages,
             intents=discord.Intents(
                 guilds=True,
                 members=True,
@@ -28,34 +33,156 @@ class AimBot(discord.Bot):
             owner_ids=[672768917885681678],
         )
 
+        if core.config.tracemalloc_frames:
+            tracemalloc.start(core.config.tracemalloc_frames)
+
         self.errors_webhook = None
+        self.error_reporter = core.ErrorReporter(
+            spill_path=core.config.errors_spill_path,
+            summary_interval=core.config.error_summary_interval,
+            queue_size=core.config.error_queue_size
+        )
+        self.rest_scheduler = core.RestScheduler(
+            global_rate=core.config.rest_global_rate,
+            background_reserve=core.config.rest_background_reserve
+        )
+        self.http.request = self.rest_scheduler.wrap(self.http.request)
+        core.member_cache.install(self)
+        self.command_sync_cache = core.CommandSyncCache(core.config.command_sync_path)
+        self.help_menu = core.HelpMenu(self)
 
         for filename in os.listdir("cogs"):
-            if filename.endswith(".py"):
+            # modules starting with an underscore are imported by the cogs themselves
+            if filename.endswith(".py") and not filename.startswith("_"):
                 self.load_cog(f"cogs.{filename[:-3]}")
+        core.startup_report.mark("cogs loaded")
 
     # noinspection PyProtectedMember
     @property
     def http_session(self) -> ClientSession:
         return self.http._HTTPClient__session
 
+    async def login(self, token: str) -> None:
+        await super().login(token)
+        core.startup_report.mark("logged in")
+        # the session only exists after logging in, the scheduler reads the rate limit headers of its responses
+        self.http_session.trace_configs.append(self.rest_scheduler.trace_config)
+
+    async def process_application_commands(self, interaction: discord.Interaction, auto_sync: bool | None = None):
+        # the interaction responses themselves don't go through the scheduler, only the other requests of commands
+        with core.rest_lane(core.Lane.INTERACTION):
+            await super().process_application_commands(interaction, auto_sync)
+
+    async def sync_commands(self, *args, **kwargs) -> None:
+        self.command_sync_cache.reset_stats()
+        await super().sync_commands(*args, **kwargs)
+        print(self.command_sync_cache.format_summary())
+
+    async def register_commands(self, commands: list[discord.ApplicationCommand] | None = None,
+                                guild_id: int | None = None, method: str = "bulk", force: bool = False,
+                                delete_existing: bool = True) -> list[dict]:
+        if commands is None:
+            commands = self.pending_application_commands
+        # the application is part of the scope, so a test bot sharing the cache file never skips a sync
+        scope = f"{self.user and self.user.id}:{'global' if guild_id is None else guild_id}"
+        scoped_commands = [
+            command for command in commands
+            if (command.guild_ids is None if guild_id is None else guild_id in (command.guild_ids or ()))
+        ]
+        digest = core.get_command_digest(scoped_commands)
+
+        # unchanged commands are still registered from the last run, only their IDs have to be restored
+        registered = None if force else self.command_sync_cache.get(scope, digest)
+        if registered is not None:
+            for data in registered:
+                command = discord.utils.get(scoped_commands, name=data["name"], type=data["type"])
+                if command is not None:
+                    command.id = data["id"]
+                    self._application_commands[command.id] = command
+            return registered
+
+        calls = sum(self.rest_scheduler.requests.values())
+        start = time.perf_counter()
+        registered = await super().register_commands(commands, guild_id, method, force, delete_existing)
+        self.command_sync_cache.put(
+            scope, digest, registered,
+            calls=sum(self.rest_scheduler.requests.values()) - calls,
+            seconds=time.perf_counter() - start
+        )
+        return registered
+
+    def _schedule_event(self, coro, event_name: str, *args, **kwargs):
+        event_filter: core.EventFilter | None = getattr(coro, "__event_filter__", None)
+        if event_filter is not None and not event_filter.check(*args):
+            return None
+        return super()._schedule_event(coro, event_name, *args, **kwargs)
+
+    def get_event_filter_stats(self) -> dict[str, tuple[int, int]]:
+        """Gets how many events every filtered listener received and how many were dropped.
+
+        Returns
+        -------
+        dict[:class:`str`, tuple[:class:`int`, :class:`int`]]
+            The passed and filtered event counts, keyed by the qualified name of the listener."""
+        stats = {}
+        for listeners in self._event_handlers.values():
+            for listener in listeners:
+                event_filter: core.EventFilter | None = getattr(listener, "__event_filter__", None)
+                if event_filter is not None:
+                    stats[listener.__qualname__] = (event_filter.passed, event_filter.filtered)
+        return stats
+
+    def add_cog(self, cog: discord.Cog, *, override: bool = False) -> None:
+        start = time.perf_counter()
+        super().add_cog(cog, override=override)
+        self._cog_setup_time += time.perf_counter() - start
+        self.help_menu.invalidate()
+
+    def remove_cog(self, name: str) -> discord.Cog | None:
+        cog = super().remove_cog(name)
+        self.help_menu.invalidate()
+        return cog
+
     def load_cog(self, cog: str) -> None:
+        # loading an extension imports it and calls its setup function, which adds the cog
+        self._cog_setup_time = 0.0
+        start = time.perf_counter()
         try:
             self.load_extension(cog)
         except Exception as e:
             e = getattr(e, "original", e)
             print("".join(traceback.format_exception(type(e), e, e.__traceback__)))
+            return
+        elapsed = time.perf_counter() - start
+        core.startup_report.cogs[cog] = (elapsed - self._cog_setup_time, self._cog_setup_time)
+
+    async def on_connect(self):
+        core.startup_report.mark("gateway connected")
+        await super().on_connect()
 
     async def on_ready(self):
         if self.on_ready_fired:
             return
         self.on_ready_fired = True
+        core.startup_report.mark("ready")
 
         self.errors_webhook: discord.Webhook = discord.Webhook.from_url(
             os.environ.get("ERRORS_WEBHOOK"),
             session=self.http_session,
             bot_token=self.http.token,
         )
+        self.error_reporter.start(self.send_error_report)
+
+        core.directory_index.warm_start()
+        core.cache_budget.start(self)
+        core.tag_store.reload_if_changed()
+        # command mentions need the IDs the commands got when they were synced on connect
+        self.help_menu.render()
+        for guild in self.guilds:
+            core.member_cache.start(guild)
+            core.role_member_index.build(guild)
+            for thread in guild.threads:
+                core.thread_owner_index.add(thread)
 
         msg = f"""{self.user.name} is online now!
             BotID: {self.user.id}
@@ -64,6 +191,9 @@ class AimBot(discord.Bot):
             Python Version: {platform.python_version()}
             PyCord API version: {discord.__version__}"""
         print(f"\n\n{msg}\n\n")
+        print(core.startup_report.format())
+
+        await core.reconcile_thread_directories(self)
 
     async def on_application_command_error(self, ctx: discord.ApplicationContext, error: Exception):
         if isinstance((error := error.original), discord.HTTPException):
@@ -72,22 +202,13 @@ class AimBot(discord.Bot):
             if error.text:
                 description += f": {error.text}"
 
-            description_chunks = textwrap.wrap(description, 1014, break_long_words=False, break_on_hyphens=False)
-
-            error_embed = discord.Embed(
+            pages = core.paginate_fields(
+                core.pack_text(description, code_language="py"),
                 title="HTTP Exception",
-                color=discord.Color.red(),
-                timestamp=discord.utils.utcnow()
+                color=discord.Color.red()
             )
-            for i, chunk in enumerate(description_chunks):
-                error_embed.add_field(
-                    name="",
-                    value=f"```py\n{chunk}```",
-                    inline=False
-                )
-
-            return await ctx.respond(embed=error_embed)
 
+            return await ctx.respond(embeds=pages[0])
 
         await ctx.respond(embed=discord.Embed(
             title="Error",
@@ -101,71 +222,23 @@ class AimBot(discord.Bot):
         else:
             guild = "None (DMs)"
 
-        error_description = str(error)
-        formatted_error = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
-
-        error_chunks = textwrap.wrap(formatted_error, 1014, break_long_words=False, break_on_hyphens=False)
-
-        error_embed = discord.Embed(
-            title=error.__class__.__name__,
-            description=error_description,
-            color=discord.Color.red(),
-            timestamp=discord.utils.utcnow()
-        )
-        error_embed.add_field(name="Command:", value=f"`/{ctx.command.qualified_name}`", inline=True)
-        error_embed.add_field(name="Guild:", value=f"`{guild}`", inline=True)
-
-        for i, chunk in enumerate(error_chunks):
-            if i == 0:
-                error_embed.add_field(
-                    name="Error:",
-                    value=f"```py\n{chunk}```",
-                    inline=False)
-            else:
-                error_embed.add_field(
-                    name="",
-                    value=f"```py\n{chunk}```",
-                    inline=False
-                )
-
-        return await self.errors_webhook.send(
-            embed=error_embed,
-            avatar_url=self.user.display_avatar.url
-        )
+        self.error_reporter.report(error, [
+            ("Command:", f"`/{ctx.command.qualified_name}`"),
+            ("Guild:", f"`{guild}`")
+        ])
 
     async def on_error(self, event: str, *args, **kwargs):
-        _, error, error_traceback = sys.exc_info()
-
-        error_description = str(error)
-        formatted_error = ''.join(traceback.format_exception(type(error), error, error_traceback))
+        _, error, _ = sys.exc_info()
 
-        error_chunks = textwrap.wrap(formatted_error, 1014, break_long_words=False, break_on_hyphens=False)
+        self.error_reporter.report(error, [
+            ("Event:", core.code_block(event, language="py")),
+            ("Args:", core.code_block(str(args), language="py")),
+            ("KwArgs:", core.code_block(str(kwargs), language="py"))
+        ])
 
-        error_embed = discord.Embed(
-            title=error.__class__.__name__,
-            description=error_description,
-            color=discord.Color.red(),
-            timestamp=discord.utils.utcnow()
-        )
-        error_embed.add_field(name="Event:", value=f"```py\n{event}```", inline=True)
-        error_embed.add_field(name="Args:", value=f"```py\n{args}```", inline=True)
-        error_embed.add_field(name="KwArgs:", value=f"```py\n{kwargs}```", inline=True)
-
-        for i, chunk in enumerate(error_chunks):
-            if i == 0:
-                error_embed.add_field(
-                    name="Error:",
-                    value=f"```py\n{chunk}```",
-                    inline=False)
-            else:
-                error_embed.add_field(
-                    name="",
-                    value=f"```py\n{chunk}```",
-                    inline=False
-                )
-
-        return await self.errors_webhook.send(
-            embed=error_embed,
+    async def send_error_report(self, embed: discord.Embed) -> None:
+        await self.errors_webhook.send(
+            embed=embed,
             avatar_url=self.user.display_avatar.url
         )
 
@@ -0,0 +1,372 @@
+import asyncio
+import itertools
+import sys
+import time
+import traceback
+import tracemalloc
+from collections.abc import Collection
+from dataclasses import dataclass
+
+import discord
+
+import core
+from .startup import get_peak_memory
+
+__all__ = (
+    "cache_budget",
+    "CacheBudget",
+    "CacheStats",
+    "estimate_size",
+    "member_cache",
+    "MemberCachePolicy",
+)
+
+# types of attribute values owned by an object, other values like the guild or the connection state are shared
+OWNED_TYPES = (str, bytes, int, float, list, tuple, dict, set, frozenset)
+
+
+class MemberCachePolicy:
+    """Decides which members are kept in the member cache.
+
+    In ``all`` mode, every member is cached by chunking the guilds before ready, like discord does by default. In
+    ``roles`` mode, guilds aren't chunked at startup. Instead, the members of the guild are listed in the
+    background after ready and only the members with a tracked role are cached, which are the ping role and the
+    roles of :data:`core.config.member_cache_role_ids`. Other members are never cached, commands get them resolved
+    in the interaction and mentions only need their IDs."""
+
+    def __init__(self, mode: str, role_ids: set[int]) -> None:
+        """Initialises a new member cache policy.
+
+        Parameters
+        ----------
+        mode: :class:`str`
+            ``all`` to cache every member or ``roles`` to cache the members with a tracked role only.
+        role_ids: set[:class:`int`]
+            The IDs of the roles tracked in every guild, in addition to the ping role of the guild."""
+        if mode not in ("all", "roles"):
+            raise ValueError(f"Unknown member cache mode: {mode}")
+        self.mode: str = mode
+        self.role_ids: set[int] = role_ids
+        self._tasks: dict[int, asyncio.Task] = {}
+
+    @property
+    def chunk_at_startup(self) -> bool:
+        """Whether the guilds have to be chunked before ready."""
+        return self.mode == "all"
+
+    @property
+    def cache_flags(self) -> discord.MemberCacheFlags | None:
+        """The member cache flags of the bot, or ``None`` for discord's defaults.
+
+        In ``roles`` mode, members are only cached when they join or get updated, so every cached member goes
+        through the policy. Members of interactions are never cached."""
+        if self.mode == "all":
+            return None
+        return discord.MemberCacheFlags(joined=True, interaction=False, voice=False)
+
+    def install(self, bot: discord.Bot) -> None:
+        """Hooks the policy into the member update parser of the bot, in ``roles`` mode only.
+
+        discord caches a member it receives an update for without dispatching ``on_member_update`` if the member
+        wasn't cached before, which is most members in ``roles`` mode. The hook passes these members to
+        :meth:`handle_member_cached` instead, so a member that gained a tracked role is indexed and every other
+        member is evicted again.
+
+        Parameters
+        ----------
+        bot: :class:`discord.Bot`
+            The bot to hook the policy into."""
+        if self.mode == "all":
+            return
+        connection = bot._connection
+        parse_guild_member_update = connection.parsers["GUILD_MEMBER_UPDATE"]
+
+        def parse(data: dict) -> None:
+            guild = connection._get_guild(int(data["guild_id"]))
+            member_id = int(data["user"]["id"])
+            was_cached = guild is not None and guild.get_member(member_id) is not None
+            parse_guild_member_update(data)
+            if guild is not None and not was_cached and (member := guild.get_member(member_id)) is not None:
+                self.handle_member_cached(member)
+
+        connection.parsers["GUILD_MEMBER_UPDATE"] = parse
+
+    def tracked_role_ids(self, guild_id: int) -> set[int]:
+        """Gets the IDs of the roles whose members are cached in a guild.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild."""
+        return self.role_ids | core.RoleMemberIndex.tracked_role_ids(guild_id)
+
+    def keeps(self, member: discord.Member) -> bool:
+        """Checks whether a member should be cached.
+
+        Parameters
+        ----------
+        member: :class:`discord.Member`
+            The member to check."""
+        return self.mode == "all" or self.is_tracked(member)
+
+    def is_tracked(self, member: discord.Member) -> bool:
+        """Checks whether a member is the bot itself or has a tracked role.
+
+        Parameters
+        ----------
+        member: :class:`discord.Member`
+            The member to check."""
+        if member.id == member.guild.me.id:
+            return True
+        return any(member.get_role(role_id) is not None for role_id in self.tracked_role_ids(member.guild.id))
+
+    def start(self, guild: discord.Guild) -> None:
+        """Starts caching the tracked members of a guild in the background, in ``roles`` mode only.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild to cache the members of."""
+        if self.mode == "roles" and guild.id not in self._tasks:
+            self._tasks[guild.id] = asyncio.create_task(self._populate(guild))
+
+    async def wait(self, guild: discord.Guild) -> None:
+        """Waits until the tracked members of a guild are cached.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild to wait for."""
+        task = self._tasks.get(guild.id)
+        if task is not None:
+            await asyncio.shield(task)
+
+    async def _populate(self, guild: discord.Guild) -> None:
+        """Lists the members of a guild and caches the ones with a tracked role."""
+        start = time.perf_counter()
+        listed = cached = 0
+        try:
+            with core.rest_lane(core.Lane.BACKGROUND):
+                async for member in guild.fetch_members(limit=None):
+                    listed += 1
+                    if self.keeps(member):
+                        guild._add_member(member)
+                        cached += 1
+        except Exception as e:
+            # the members listed so far stay cached, waiting commands go on with them
+            print("".join(traceback.format_exception(type(e), e, e.__traceback__)))
+        core.role_member_index.build(guild)
+        print(f"Cached {cached} of {listed} members of {guild.name} in {time.perf_counter() - start:.2f}s, "
+              f"{get_peak_memory() or 0:.1f} MiB peak resident memory")
+
+    def handle_member_cached(self, member: discord.Member) -> None:
+        """Indexes a member discord cached from an update without dispatching it, or evicts it if it shouldn't be
+        cached.
+
+        Parameters
+        ----------
+        member: :class:`discord.Member`
+            The member that was cached."""
+        core.role_member_index.handle_member_join(member)
+        self.handle_member(member)
+
+    def handle_member(self, member: discord.Member) -> None:
+        """Evicts a member from the cache if it shouldn't be cached, after it joined or was updated.
+
+        Parameters
+        ----------
+        member: :class:`discord.Member`
+            The member that joined or was updated."""
+        if not self.keeps(member):
+            member.guild._remove_member(member)
+
+
+member_cache = MemberCachePolicy(core.config.member_cache_mode, core.config.member_cache_role_ids)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Represents the size of a cache.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the cache.
+    count: :class:`int`
+        The number of cached objects.
+    size: :class:`int`
+        The estimated size of the cached objects, in bytes.
+    limit: Optional[:class:`int`]
+        The maximum number of cached objects, or ``None`` if the cache is unbounded."""
+    name: str
+    count: int
+    size: int
+    limit: int | None = None
+
+
+def get_slots(cls: type) -> tuple[str, ...]:
+    """Gets the slots a class declares itself, a single slot may be declared as a plain string."""
+    slots = getattr(cls, "__slots__", ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+
+def estimate_size(objects: Collection, *, sample: int = 32) -> int:
+    """Estimates the memory used by objects from the first few of them.
+
+    The size of an object includes the values of its attributes that it owns, like strings and lists, but not
+    shared objects like its guild.
+
+    Parameters
+    ----------
+    objects: Collection
+        The objects.
+    sample: :class:`int`
+        The number of objects to measure.
+
+    Returns
+    -------
+    :class:`int`
+        The estimated size of all objects, in bytes."""
+    if not objects:
+        return 0
+    sampled = list(itertools.islice(objects, sample))
+    total = 0
+    for obj in sampled:
+        total += sys.getsizeof(obj)
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is None:
+            slots = itertools.chain.from_iterable(get_slots(cls) for cls in type(obj).__mro__)
+            attributes = {slot: getattr(obj, slot, None) for slot in slots}
+        total += sum(sys.getsizeof(value) for value in attributes.values() if isinstance(value, OWNED_TYPES))
+    return total * len(objects) // len(sampled)
+
+
+class CacheBudget:
+    """Caps the caches of the bot, so its memory stays within a known budget.
+
+    The message cache is bounded by discord itself. Threads and members are trimmed periodically: archived threads
+    are evicted longest archived first and members without a tracked role are evicted until a guild is within its
+    cap. Active threads, the bot itself and members with a tracked role are never evicted."""
+
+    def __init__(self, *, max_messages: int | None, max_threads: int | None, max_members: int | None,
+                 trim_interval: float) -> None:
+        """Initialises a new cache budget.
+
+        Parameters
+        ----------
+        max_messages: Optional[:class:`int`]
+            The maximum number of cached messages, or ``None`` to not cache messages at all.
+        max_threads: Optional[:class:`int`]
+            The maximum number of cached threads per guild, or ``None`` for no limit.
+        max_members: Optional[:class:`int`]
+            The maximum number of cached members per guild, or ``None`` for no limit.
+        trim_interval: :class:`float`
+            The interval between trims, in seconds."""
+        self.max_messages: int | None = max_messages
+        self.max_threads: int | None = max_threads
+        self.max_members: int | None = max_members
+        self.trim_interval: float = trim_interval
+        self.evicted_threads: int = 0
+        self.evicted_members: int = 0
+        self._worker: asyncio.Task | None = None
+
+    def start(self, bot: discord.Bot) -> None:
+        """Starts trimming the caches periodically.
+
+        Parameters
+        ----------
+        bot: :class:`discord.Bot`
+            The bot to trim the caches of."""
+        if self._worker is None and (self.max_threads is not None or self.max_members is not None):
+            self._worker = asyncio.create_task(self._work(bot))
+
+    async def _work(self, bot: discord.Bot) -> None:
+        """Trims the caches every interval."""
+        while True:
+            for guild in bot.guilds:
+                self.trim(guild)
+            await asyncio.sleep(self.trim_interval)
+
+    def trim(self, guild: discord.Guild) -> None:
+        """Evicts threads and members of a guild above the caps.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild to trim the caches of."""
+        if self.max_threads is not None and len(guild.threads) > self.max_threads:
+            archived = sorted(
+                (thread for thread in guild.threads if thread.archived),
+                key=lambda thread: thread.archive_timestamp
+            )
+            for thread in archived[:len(guild.threads) - self.max_threads]:
+                guild._remove_thread(thread)
+                self.evicted_threads += 1
+        if self.max_members is not None and len(guild.members) > self.max_members:
+            untracked = [member for member in guild.members if not member_cache.is_tracked(member)]
+            for member in untracked[:len(guild.members) - self.max_members]:
+                guild._remove_member(member)
+                self.evicted_members += 1
+
+    def get_stats(self, bot: discord.Bot) -> list[CacheStats]:
+        """Gets the number of objects and estimated size of every cache.
+
+        Parameters
+        ----------
+        bot: :class:`discord.Bot`
+            The bot to get the caches of.
+
+        Returns
+        -------
+        list[:class:`CacheStats`]
+            The stats of every cache."""
+        members = [member for guild in bot.guilds for member in guild.members]
+        threads = [thread for guild in bot.guilds for thread in guild.threads]
+        channels = [channel for guild in bot.guilds for channel in guild.channels]
+        directory_messages = core.directory_writer.messages.cached
+        per_guild = len(bot.guilds) or 1
+        return [
+            CacheStats("Messages", len(bot.cached_messages), estimate_size(bot.cached_messages),
+                       self.max_messages),
+            CacheStats("Members", len(members), estimate_size(members),
+                       self.max_members * per_guild if self.max_members is not None else None),
+            CacheStats("Threads", len(threads), estimate_size(threads),
+                       self.max_threads * per_guild if self.max_threads is not None else None),
+            CacheStats("Users", len(bot.users), estimate_size(bot.users)),
+            CacheStats("Channels", len(channels), estimate_size(channels)),
+            CacheStats("Directory Messages", len(directory_messages), estimate_size(directory_messages)),
+            CacheStats("Tags", len(core.tag_store.tags), estimate_size(list(core.tag_store.tags.values())))
+        ]
+
+    @staticmethod
+    def get_top_allocators(limit: int = 10) -> list[str] | None:
+        """Gets the source lines that allocated the most memory still in use.
+
+        Parameters
+        ----------
+        limit: :class:`int`
+            The maximum number of source lines.
+
+        Returns
+        -------
+        Optional[list[:class:`str`]]
+            The size, allocation count and location of every source line, or ``None`` if tracemalloc isn't
+            tracing."""
+        if not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        return [
+            f"{statistic.size / 1024:>9.1f} KiB {statistic.count:>7} {statistic.traceback[0]}"
+            for statistic in snapshot.statistics("lineno")[:limit]
+        ]
+
+
+cache_budget = CacheBudget(
+    max_messages=core.config.max_messages,
+    max_threads=core.config.max_threads,
+    max_members=core.config.max_members,
+    trim_interval=core.config.cache_trim_interval
+)
@@ -1,13 +1,64 @@
 version: str = "2.4.4"
 
+add_members_strategy: str = "pack"  # "pack", "parallel" or "direct"
+add_members_concurrency: int = 4
+
 bell_tag_id = 1132640430090113024
 
+cache_trim_interval: float = 600.0  # seconds between trims of the thread and member caches
+
+command_sync_path: str = "command_sync.json"  # registration state of the commands from the last sync
+
+database_path: str = "aim.db"
+
+directory_write_delay: float = 2.0
+directory_retry_delay: float = 30.0  # seconds before a failed directory write is retried
+
+error_queue_size: int = 100
+error_summary_interval: float = 300.0  # seconds between summaries of repeated errors
+errors_spill_path: str = "errors.log"  # reports that couldn't be sent to the errors webhook
+
+lazy_cogs: bool = False  # import the UI classes of heavy cogs on first use instead of at startup
+
+max_messages: int | None = 100  # the directory and embed tool don't rely on discord's message cache
+max_threads: int | None = None  # per guild, only archived threads are evicted
+max_members: int | None = None  # per guild, members with a tracked role are never evicted
+
+thread_directories: dict[int, tuple[int, int]] = {  # guild id: (channel id, message id)
+    933075515881951292: (1152697393825976440, 1152718564944511037),  # RIP
+    959162264081014814: (959198464900747304, 1126961535605014609),  # SEA
+    849650258786779196: (1041033326846296164, 1126961177990287441),  # EAR
+    915333299981934692: (1160158020295217223, 1160158296834064384)  # TEST
+}
+
 rip_guild_id = 933075515881951292
 
 rip_ticket_channel_id = 933089346255478854
 rip_mod_role_id = 933098293146292325
 
 feedback_channel_id = 1019760331532275732
+
+ping_roles: dict[int, int | None] = {  # guild id: ping role id
+    933075515881951292: 939633923305132182,  # RIP
+    959162264081014814: 939633923305132182,  # SEA
+    849650258786779196: None,  # EAR
+    915333299981934692: 941942976429559808  # TEST
+}
+
+member_cache_mode: str = "all"  # "all" or "roles", see core.MemberCachePolicy
+member_cache_role_ids: set[int] = {rip_mod_role_id}  # roles whose members are cached besides the ping roles
+
+reconcile_concurrency: int = 2
+
+rest_global_rate: int = 50  # requests per second across all routes
+rest_background_reserve: int = 10  # global tokens background requests leave for the other lanes
+
+tags_path: str = "data/tags.json"
+
+thread_delete_concurrency: int = 5
+
+tracemalloc_frames: int = 0  # frames traced per allocation for /debug memory, 0 to disable tracemalloc
+
 feedback_strings = [
     "## Feedback",
     "<:Overworld:1132644632489103371>  Overworld",
@@ -0,0 +1,840 @@
+import asyncio
+import datetime
+import json
+import re
+import time
+from dataclasses import dataclass, field
+
+import discord
+
+import core
+from .layout import pack_lines, paginate_fields
+from .store import DirectoryStore
+
+__all__ = (
+    "directory_index",
+    "directory_writer",
+    "DirectoryEntry",
+    "DirectoryMessageCache",
+    "DirectoryOperation",
+    "reconcile_thread_directories",
+    "ThreadDirectoryIndex",
+    "ThreadDirectoryWriter",
+)
+
+CHANNEL_MENTION_PATTERN = re.compile(r"<#(\d+)>")
+TIMESTAMP_PATTERN = re.compile(r"<t:(\d+)(?::\w)?>")
+
+
+@dataclass
+class DirectoryEntry:
+    """Represents a single thread listed in a thread directory.
+
+    Attributes
+    ----------
+    thread_id: :class:`int`
+        The ID of the thread.
+    parent_id: :class:`int`
+        The ID of the parent channel of the thread.
+    waiting_since: Optional[:class:`datetime.datetime`]
+        When the thread started waiting for feedback. Only used by feedback thread directories."""
+    thread_id: int
+    parent_id: int
+    waiting_since: datetime.datetime | None = None
+
+
+class ThreadDirectoryIndex:
+    """Per-guild in-memory index of the threads listed in the thread directories.
+
+    The index maps thread IDs to their directory entries so a directory can be regrouped locally
+    instead of re-parsing the directory embed and fetching every listed channel. It is warm-started from
+    and writes every change through to a :class:`DirectoryStore`."""
+
+    def __init__(self, store: DirectoryStore) -> None:
+        """Initialises a new thread directory index.
+
+        Parameters
+        ----------
+        store: :class:`DirectoryStore`
+            The store backing the index."""
+        self.store: DirectoryStore = store
+        self._entries: dict[int, dict[int, DirectoryEntry]] = {}
+        self._warm_started: bool = False
+
+    def warm_start(self) -> None:
+        """Loads the index from the store, if it hasn't been loaded yet."""
+        if self._warm_started:
+            return
+        self._warm_started = True
+        for guild_id in self.store.load_migrated_guilds():
+            self._entries.setdefault(guild_id, {})
+        for guild_id, thread_id, parent_id, waiting_since in self.store.load_entries():
+            self._entries.setdefault(guild_id, {})[thread_id] = DirectoryEntry(thread_id, parent_id, waiting_since)
+
+    def is_loaded(self, guild_id: int) -> bool:
+        """Checks whether the directory of the guild specified has been migrated to the store.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild to check."""
+        self.warm_start()
+        return guild_id in self._entries
+
+    def migrate(self, guild_id: int, embed: discord.Embed, *, parent_id: int | None = None) -> None:
+        """Migrates the directory of a guild from its existing directory embed to the store.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild the directory belongs to.
+        embed: :class:`discord.Embed`
+            The directory embed to parse.
+        parent_id: Optional[:class:`int`]
+            The parent ID of all listed threads. If not given, the parent IDs are read from the field names."""
+        entries = {entry.thread_id: entry for entry in parse_directory_embed(embed, parent_id=parent_id)}
+        with self.store.transaction():
+            for entry in entries.values():
+                self.store.add_entry(guild_id, entry.thread_id, entry.parent_id, entry.waiting_since)
+            self.store.mark_migrated(guild_id)
+        self._entries[guild_id] = entries
+
+    def add(self, guild_id: int, thread_id: int, parent_id: int, *,
+            waiting_since: datetime.datetime | None = None) -> bool:
+        """Adds a thread to the index and the store.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild the thread belongs to.
+        thread_id: :class:`int`
+            The ID of the thread to add.
+        parent_id: :class:`int`
+            The ID of the parent channel of the thread.
+        waiting_since: Optional[:class:`datetime.datetime`]
+            When the thread started waiting for feedback.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the thread was added, ``False`` if it was already indexed."""
+        entries = self._entries.setdefault(guild_id, {})
+        if thread_id in entries:
+            return False
+        entries[thread_id] = DirectoryEntry(thread_id, parent_id, waiting_since)
+        self.store.add_entry(guild_id, thread_id, parent_id, waiting_since)
+        return True
+
+    def remove(self, guild_id: int, thread_id: int) -> bool:
+        """Removes a thread from the index and the store.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild the thread belongs to.
+        thread_id: :class:`int`
+            The ID of the thread to remove.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the thread was removed, ``False`` if it wasn't indexed."""
+        if self._entries.get(guild_id, {}).pop(thread_id, None) is None:
+            return False
+        self.store.remove_entry(thread_id)
+        return True
+
+    def entries(self, guild_id: int) -> list[DirectoryEntry]:
+        """Gets the entries of a guild in the order they were added.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild to get the entries of."""
+        return list(self._entries.get(guild_id, {}).values())
+
+    def grouped(self, guild_id: int) -> dict[int, list[int]]:
+        """Gets the thread IDs of a guild grouped by their parent IDs.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild to group the thread IDs of.
+
+        Returns
+        -------
+        dict[:class:`int`, list[:class:`int`]]
+            The thread IDs keyed by parent ID, both in the order they were added."""
+        groups: dict[int, list[int]] = {}
+        for entry in self._entries.get(guild_id, {}).values():
+            groups.setdefault(entry.parent_id, []).append(entry.thread_id)
+        return groups
+
+
+def parse_directory_embed(embed: discord.Embed, *, parent_id: int | None = None) -> list[DirectoryEntry]:
+    """Parses the entries of a directory embed. Only used to migrate directories to the store.
+
+    Parameters
+    ----------
+    embed: :class:`discord.Embed`
+        The directory embed to parse.
+    parent_id: Optional[:class:`int`]
+        The parent ID of all listed threads. If not given, the parent IDs are read from the field names,
+        unnamed fields continue the previous parent.
+
+    Returns
+    -------
+    list[:class:`DirectoryEntry`]
+        The entries listed in the embed, in order."""
+    entries: list[DirectoryEntry] = []
+    field_parent_id = parent_id
+    for embed_field in embed.fields:
+        if parent_id is None and (match := CHANNEL_MENTION_PATTERN.search(embed_field.name or "")) is not None:
+            field_parent_id = int(match.group(1))
+        if field_parent_id is None:
+            continue
+        for line in embed_field.value.splitlines():
+            match = CHANNEL_MENTION_PATTERN.search(line)
+            if match is None:
+                continue
+            waiting_since = None
+            if (timestamp := TIMESTAMP_PATTERN.search(line)) is not None:
+                waiting_since = datetime.datetime.fromtimestamp(int(timestamp.group(1)), tz=datetime.timezone.utc)
+            entries.append(DirectoryEntry(int(match.group(1)), field_parent_id, waiting_since))
+    return entries
+
+
+@dataclass
+class DirectoryOperation:
+    """Represents a pending change to a thread directory.
+
+    Attributes
+    ----------
+    guild: :class:`discord.Guild`
+        The guild of the thread directory.
+    added: dict[:class:`int`, :class:`int`]
+        The parent IDs of the threads to add, keyed by thread ID.
+    removed: set[:class:`int`]
+        The IDs of the threads to remove.
+    replace: :class:`bool`
+        Whether all threads that aren't in ``added`` are removed.
+    feedback: :class:`bool`
+        Whether the directory is a feedback thread directory.
+    waiting_since: Optional[:class:`datetime.datetime`]
+        When the added threads started waiting for feedback.
+    future: :class:`asyncio.Future`
+        Resolved with whether the directory could be updated once the operation has been written."""
+    guild: discord.Guild
+    added: dict[int, int] = field(default_factory=dict)
+    removed: set[int] = field(default_factory=set)
+    replace: bool = False
+    feedback: bool = False
+    waiting_since: datetime.datetime | None = None
+    future: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class DirectoryMessageCache:
+    """Cache of the thread directory messages, keyed by message ID.
+
+    A directory message is fetched once and then kept up to date from the messages returned by its edits and
+    from the raw message edit and delete events. It is only fetched again if it is known to be stale or an edit
+    fails because the cached message is no longer valid."""
+
+    def __init__(self) -> None:
+        """Initialises a new, empty directory message cache."""
+        self._messages: dict[int, discord.Message] = {}
+        self._stale: set[int] = set()
+
+    async def get(self, channel: discord.abc.Messageable, message_id: int) -> discord.Message | None:
+        """Gets a thread directory message, fetching it if it isn't cached or stale.
+
+        Parameters
+        ----------
+        channel: :class:`discord.abc.Messageable`
+            The channel of the thread directory message.
+        message_id: :class:`int`
+            The ID of the thread directory message.
+
+        Returns
+        -------
+        Optional[:class:`discord.Message`]
+            The thread directory message, or ``None`` if it doesn't exist."""
+        if message_id in self._messages and message_id not in self._stale:
+            return self._messages[message_id]
+        try:
+            message = await channel.fetch_message(message_id)
+        except discord.NotFound:
+            self.invalidate(message_id)
+            return None
+        self._messages[message_id] = message
+        self._stale.discard(message_id)
+        return message
+
+    async def edit(self, channel: discord.abc.Messageable, message_id: int, **fields) -> bool:
+        """Edits a thread directory message, refetching it once if the cached message is invalid.
+
+        Parameters
+        ----------
+        channel: :class:`discord.abc.Messageable`
+            The channel of the thread directory message.
+        message_id: :class:`int`
+            The ID of the thread directory message.
+        **fields: Any
+            The fields to pass to :meth:`discord.Message.edit`.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the message was edited, ``False`` if it doesn't exist."""
+        message = await self.get(channel, message_id)
+        if message is None:
+            return False
+        try:
+            message = await message.edit(**fields)
+        except discord.NotFound:
+            self.invalidate(message_id)
+            message = await self.get(channel, message_id)
+            if message is None:
+                return False
+            message = await message.edit(**fields)
+        self._messages[message_id] = message
+        return True
+
+    @property
+    def cached(self) -> list[discord.Message]:
+        """The cached thread directory messages."""
+        return list(self._messages.values())
+
+    def add(self, message: discord.Message) -> None:
+        """Adds a freshly sent thread directory message to the cache.
+
+        Parameters
+        ----------
+        message: :class:`discord.Message`
+            The message to add."""
+        self._messages[message.id] = message
+        self._stale.discard(message.id)
+
+    def invalidate(self, message_id: int) -> None:
+        """Removes a thread directory message from the cache.
+
+        Parameters
+        ----------
+        message_id: :class:`int`
+            The ID of the message."""
+        self._messages.pop(message_id, None)
+        self._stale.discard(message_id)
+
+    def handle_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """Marks a cached directory message as stale if it was edited by anything but the directory writer.
+
+        Parameters
+        ----------
+        payload: :class:`discord.RawMessageUpdateEvent`
+            The payload of the message edit."""
+        message = self._messages.get(payload.message_id)
+        if message is None:
+            return
+        edited_timestamp = payload.data.get("edited_timestamp")
+        if edited_timestamp is not None and discord.utils.parse_time(edited_timestamp) == message.edited_at:
+            return
+        self._stale.add(payload.message_id)
+
+    def handle_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """Removes a cached directory message from the cache once it is deleted.
+
+        Parameters
+        ----------
+        payload: :class:`discord.RawMessageDeleteEvent`
+            The payload of the message deletion."""
+        self.invalidate(payload.message_id)
+
+
+class ThreadDirectoryWriter:
+    """Debounced writer for the thread directory messages.
+
+    Every guild has a mutation queue owned by a single worker task. The worker collects the queued operations
+    for :data:`core.config.directory_write_delay` seconds, applies them to the directory index in order and
+    writes them with a single message edit.
+
+    Attributes
+    ----------
+    index: :class:`ThreadDirectoryIndex`
+        The index the operations are applied to.
+    messages: :class:`DirectoryMessageCache`
+        The cache of the thread directory messages.
+    sent_edits: :class:`int`
+        The number of directory messages edited or sent.
+    coalesced_edits: :class:`int`
+        The number of operations that were written as part of another operation's edit or needed no edit.
+    unchanged_pages: :class:`int`
+        The number of directory pages that were skipped because their content didn't change."""
+
+    def __init__(self, index: ThreadDirectoryIndex) -> None:
+        """Initialises a new thread directory writer.
+
+        Parameters
+        ----------
+        index: :class:`ThreadDirectoryIndex`
+            The index the operations are applied to."""
+        self.index: ThreadDirectoryIndex = index
+        self.messages: DirectoryMessageCache = DirectoryMessageCache()
+        self.sent_edits: int = 0
+        self.coalesced_edits: int = 0
+        self.unchanged_pages: int = 0
+        self._page_signatures: dict[int, str] = {}
+        # whether the directory is a feedback thread directory, of the guilds whose pages are behind their index
+        self._dirty: dict[int, bool] = {}
+        self._queues: dict[int, asyncio.Queue[DirectoryOperation]] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+
+    async def add(self, thread: discord.Thread, *, feedback: bool = False) -> bool:
+        """Adds a thread to the thread directory of its guild.
+
+        Parameters
+        ----------
+        thread: :class:`discord.Thread`
+            The thread to add.
+        feedback: :class:`bool`
+            Whether the directory is a feedback thread directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the guild has a thread directory the thread could be added to."""
+        waiting_since = discord.utils.utcnow() if feedback else None
+        return await self._schedule(DirectoryOperation(
+            thread.guild, added={thread.id: thread.parent_id}, feedback=feedback, waiting_since=waiting_since
+        ))
+
+    async def remove(self, thread: discord.Thread, *, feedback: bool = False) -> bool:
+        """Removes a thread from the thread directory of its guild.
+
+        Parameters
+        ----------
+        thread: :class:`discord.Thread`
+            The thread to remove.
+        feedback: :class:`bool`
+            Whether the directory is a feedback thread directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the guild has a thread directory the thread could be removed from."""
+        return await self._schedule(DirectoryOperation(thread.guild, removed={thread.id}, feedback=feedback))
+
+    async def reconcile(self, guild: discord.Guild, thread_ids: dict[int, int], *, feedback: bool = False) -> bool:
+        """Replaces the threads of a guild's thread directory with the threads specified in one batched update.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild of the thread directory.
+        thread_ids: dict[:class:`int`, :class:`int`]
+            The parent IDs of the threads that should be listed, keyed by thread ID.
+        feedback: :class:`bool`
+            Whether the directory is a feedback thread directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the guild has a thread directory."""
+        waiting_since = discord.utils.utcnow() if feedback else None
+        return await self._schedule(DirectoryOperation(
+            guild, added=thread_ids, replace=True, feedback=feedback, waiting_since=waiting_since
+        ))
+
+    async def _schedule(self, operation: DirectoryOperation) -> bool:
+        """Queues an operation and waits until it has been written.
+
+        Parameters
+        ----------
+        operation: :class:`DirectoryOperation`
+            The operation to queue."""
+        guild = operation.guild
+        if guild.id not in self._queues:
+            self._queues[guild.id] = asyncio.Queue()
+            self._workers[guild.id] = asyncio.create_task(self._work(guild))
+        self._queues[guild.id].put_nowait(operation)
+        return await operation.future
+
+    async def _work(self, guild: discord.Guild) -> None:
+        """Applies the queued operations of a guild in order, one write window at a time.
+
+        This is the only task mutating the directory of the guild, so operations can't overwrite each other.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild to work on."""
+        # the worker has its own context, so this doesn't leak into the operation that started it
+        core.current_lane.set(core.Lane.BACKGROUND)
+        queue = self._queues[guild.id]
+        while True:
+            if guild.id in self._dirty:
+                # the last write failed, retry it with the next operations or on its own
+                try:
+                    operations = [await asyncio.wait_for(queue.get(), core.config.directory_retry_delay)]
+                except asyncio.TimeoutError:
+                    operations = []
+            else:
+                operations = [await queue.get()]
+            await asyncio.sleep(core.config.directory_write_delay)
+            while not queue.empty():
+                operations.append(queue.get_nowait())
+            try:
+                result = await self.flush(guild, operations)
+            except Exception as error:
+                if not operations:
+                    print(f"Failed to write the thread directory of {guild.name}: {error}")
+                for operation in operations:
+                    if not operation.future.done():
+                        operation.future.set_exception(error)
+                continue
+            for operation in operations:
+                if not operation.future.done():
+                    operation.future.set_result(result)
+
+    async def flush(self, guild: discord.Guild, operations: list[DirectoryOperation]) -> bool:
+        """Applies operations to the index of a guild and writes the directory pages that changed.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild the operations belong to.
+        operations: list[:class:`DirectoryOperation`]
+            The operations to apply, in order. Without operations, only a failed write is retried.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the guild has a thread directory."""
+        if guild.id not in core.config.thread_directories:
+            return False
+        channel_id, message_id = core.config.thread_directories[guild.id]
+        channel = guild.get_channel(channel_id)
+        if channel is None:
+            self._dirty.pop(guild.id, None)
+            return False
+        feedback = operations[-1].feedback if operations else self._dirty.get(guild.id, False)
+        if not await self.load(guild, feedback=feedback):
+            return False
+        changed = guild.id in self._dirty
+        with self.index.store.transaction():
+            for operation in operations:
+                removed = operation.removed
+                if operation.replace:
+                    removed = {entry.thread_id for entry in self.index.entries(guild.id)} - operation.added.keys()
+                for thread_id in removed:
+                    changed |= self.index.remove(guild.id, thread_id)
+                for thread_id, parent_id in operation.added.items():
+                    changed |= self.index.add(guild.id, thread_id, parent_id, waiting_since=operation.waiting_since)
+        if not changed:
+            self.coalesced_edits += len(operations)
+            return True
+        # the index is committed already, so the guild stays dirty until its pages have been written
+        self._dirty[guild.id] = feedback
+        if feedback:
+            pages = get_feedback_thread_directory_pages(self.index.entries(guild.id), guild)
+        else:
+            pages = get_thread_directory_pages(self.index.grouped(guild.id), guild)
+        written = await self.write_pages(guild, channel, message_id, pages)
+        # the pages were written, or the directory message is gone, which retrying can't fix
+        del self._dirty[guild.id]
+        if not written:
+            return False
+        self.coalesced_edits += max(len(operations) - 1, 0)
+        return True
+
+    async def write_pages(self, guild: discord.Guild, channel: discord.TextChannel, message_id: int,
+                          pages: list[list[discord.Embed]]) -> bool:
+        """Writes the pages of a directory, editing only the messages whose content changed.
+
+        The first page is the configured directory message, further pages are sent to the same channel and
+        their IDs are kept in the store. Pages that are no longer needed are deleted.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild the directory belongs to.
+        channel: :class:`discord.TextChannel`
+            The channel of the directory.
+        message_id: :class:`int`
+            The ID of the first directory message.
+        pages: list[list[:class:`discord.Embed`]]
+            The embeds of every page, in order.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the directory was written, ``False`` if the first directory message doesn't exist."""
+        old_message_ids = [message_id, *self.index.store.load_pages(guild.id)]
+        message_ids: list[int] = []
+        resend = False
+        for i, embeds in enumerate(pages):
+            signature = get_page_signature(embeds)
+            if not resend and i < len(old_message_ids):
+                if self._page_signatures.get(old_message_ids[i]) == signature:
+                    self.unchanged_pages += 1
+                    message_ids.append(old_message_ids[i])
+                    continue
+                if await self.messages.edit(channel, old_message_ids[i], embeds=embeds, content=None):
+                    message_ids.append(old_message_ids[i])
+                    self._page_signatures[old_message_ids[i]] = signature
+                    self.sent_edits += 1
+                    continue
+                if i == 0:
+                    return False
+                # a page in the middle was deleted, its replacement is sent below the later pages, so these are
+                # sent again after it to keep the pages in order
+                resend = True
+            message = await channel.send(embeds=embeds)
+            self.messages.add(message)
+            message_ids.append(message.id)
+            self._page_signatures[message.id] = signature
+            self.sent_edits += 1
+        for surplus_message_id in [old_id for old_id in old_message_ids if old_id not in message_ids]:
+            self._page_signatures.pop(surplus_message_id, None)
+            self.messages.invalidate(surplus_message_id)
+            try:
+                await channel.get_partial_message(surplus_message_id).delete()
+            except discord.NotFound:
+                pass
+        with self.index.store.transaction():
+            self.index.store.set_pages(guild.id, message_ids[1:])
+        return True
+
+    def handle_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """Forgets a deleted directory message, so its page is written again on the next write.
+
+        Parameters
+        ----------
+        payload: :class:`discord.RawMessageDeleteEvent`
+            The payload of the message deletion."""
+        self._page_signatures.pop(payload.message_id, None)
+        self.messages.handle_raw_message_delete(payload)
+
+    async def load(self, guild: discord.Guild, *, feedback: bool = False) -> bool:
+        """Loads the directory of a guild into the index, migrating it from its thread directory message if the
+        store doesn't have it yet.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild to load the directory of.
+        feedback: :class:`bool`
+            Whether the directory is a feedback thread directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the guild has a thread directory."""
+        if self.index.is_loaded(guild.id):
+            return True
+        if guild.id not in core.config.thread_directories:
+            return False
+        channel_id, message_id = core.config.thread_directories[guild.id]
+        channel = guild.get_channel(channel_id)
+        if channel is None:
+            return False
+        thread_dir_msg: discord.Message | None = await self.messages.get(channel, message_id)
+        if thread_dir_msg is None:
+            return False
+        if not self.index.is_loaded(guild.id):
+            self.migrate_index(thread_dir_msg, guild, feedback=feedback)
+        return True
+
+    def migrate_index(self, thread_dir_msg: discord.Message, guild: discord.Guild, *, feedback: bool = False) -> None:
+        """Migrates the directory of a guild from its thread directory message to the store.
+
+        Parameters
+        ----------
+        thread_dir_msg: :class:`discord.Message`
+            The thread directory message of the guild.
+        guild: :class:`discord.Guild`
+            The guild to migrate the directory of.
+        feedback: :class:`bool`
+            Whether the message is a feedback thread directory."""
+        embed = thread_dir_msg.embeds[0] if thread_dir_msg.embeds else discord.Embed()
+        parent_id = core.config.feedback_channel_id if feedback else None
+        self.index.migrate(guild.id, embed, parent_id=parent_id)
+
+
+async def reconcile_thread_directories(bot: discord.Bot) -> None:
+    """Reconciles the thread directories of all guilds with the threads that currently exist.
+
+    The feedback thread directory is rebuilt from the active threads and the archived threads of the feedback
+    forum, other thread directories from the active threads and the archived threads they still list. Guilds are
+    reconciled concurrently, at most :data:`core.config.reconcile_concurrency` at a time, and every guild's
+    changes are written as one batched update.
+
+    Parameters
+    ----------
+    bot: :class:`discord.Bot`
+        The bot to reconcile the thread directories of."""
+    start = time.perf_counter()
+    semaphore = asyncio.Semaphore(core.config.reconcile_concurrency)
+    guilds = [guild for guild in bot.guilds if guild.id in core.config.thread_directories]
+
+    async def reconcile_guild(guild: discord.Guild) -> int:
+        async with semaphore:
+            if guild.id == core.config.rip_guild_id:
+                return await reconcile_feedback_thread_directory(guild)
+            return await reconcile_thread_directory(guild)
+
+    with core.rest_lane(core.Lane.BACKGROUND):
+        scanned = sum(await asyncio.gather(*(reconcile_guild(guild) for guild in guilds)))
+    print(f"Reconciled {len(guilds)} thread directories in {time.perf_counter() - start:.2f}s, "
+          f"scanned {scanned} threads")
+
+
+async def reconcile_thread_directory(guild: discord.Guild) -> int:
+    """Reconciles the thread directory of a guild with the threads that currently exist.
+
+    Every valid active thread is listed. Listed threads that aren't active are kept if they are still found among
+    the archived threads of their parent channel, the archived threads are only fetched for these channels.
+
+    Parameters
+    ----------
+    guild: :class:`discord.Guild`
+        The guild to reconcile the thread directory of.
+
+    Returns
+    -------
+    :class:`int`
+        The number of threads scanned."""
+    scanned = 0
+    thread_ids: dict[int, int] = {}
+    for thread in guild.threads:
+        scanned += 1
+        core.thread_owner_index.add(thread)
+        if core.is_valid_thread(thread):
+            thread_ids[thread.id] = thread.parent_id
+
+    # the directory has to be loaded to know which of the threads it lists are archived rather than deleted
+    if await directory_writer.load(guild):
+        listed: dict[int, set[int]] = {}
+        for entry in directory_index.entries(guild.id):
+            if entry.thread_id not in thread_ids:
+                listed.setdefault(entry.parent_id, set()).add(entry.thread_id)
+        for parent_id, listed_thread_ids in listed.items():
+            parent = guild.get_channel(parent_id)
+            if not isinstance(parent, (discord.TextChannel, discord.ForumChannel)):
+                # the parent channel was deleted, and its threads with it
+                continue
+            async for thread in parent.archived_threads(limit=None):
+                scanned += 1
+                core.thread_owner_index.add(thread)
+                if thread.id in listed_thread_ids:
+                    thread_ids[thread.id] = parent_id
+    await directory_writer.reconcile(guild, thread_ids)
+    return scanned
+
+
+async def reconcile_feedback_thread_directory(guild: discord.Guild) -> int:
+    """Reconciles the feedback thread directory of a guild with the threads waiting for feedback.
+
+    Parameters
+    ----------
+    guild: :class:`discord.Guild`
+        The guild to reconcile the feedback thread directory of.
+
+    Returns
+    -------
+    :class:`int`
+        The number of threads scanned."""
+    forum = guild.get_channel(core.config.feedback_channel_id)
+    if not isinstance(forum, discord.ForumChannel):
+        return 0
+    scanned = 0
+    thread_ids: dict[int, int] = {}
+
+    def scan(thread: discord.Thread) -> None:
+        nonlocal scanned
+        scanned += 1
+        core.thread_owner_index.add(thread)
+        if thread.parent_id != forum.id:
+            return
+        if core.config.bell_tag_id in [tag.id for tag in thread.applied_tags]:
+            thread_ids[thread.id] = thread.parent_id
+
+    for thread in guild.threads:
+        scan(thread)
+    async for thread in forum.archived_threads(limit=None):
+        scan(thread)
+    await directory_writer.reconcile(guild, thread_ids, feedback=True)
+    return scanned
+
+
+def get_feedback_thread_directory_pages(entries: list[DirectoryEntry],
+                                        guild: discord.Guild) -> list[list[discord.Embed]]:
+    """Gets the pages of the feedback thread directory.
+
+    Parameters
+    ------------
+    entries: list[DirectoryEntry]
+        The directory entries to list in the feedback thread directory.
+    guild: discord.Guild
+        The guild to get the feedback thread directory for.
+
+    Returns
+    -----------
+    list[list[Embed]]
+        The embeds of every page of the feedback thread directory."""
+    lines: list[str] = []
+    for entry in entries:
+        line = f"- <#{entry.thread_id}>"
+        if entry.waiting_since is not None:
+            line += f" - Waiting since {discord.utils.format_dt(entry.waiting_since, style='R')}"
+        lines.append(line)
+    return paginate_fields(
+        pack_lines(lines, name="Feedback Threads"),
+        title="Feedback Thread Directory",
+        description="A list of all feedback threads of this server, sorted by the time they have been waiting for "
+                    "feedback. The threads at the top have been waiting the longest.",
+        color=guild.me.color,
+        footer=f"Feedback Threads: {len(entries)}"
+    )
+
+
+def get_thread_directory_pages(thread_ids_by_parent: dict[int, list[int]],
+                               guild: discord.Guild) -> list[list[discord.Embed]]:
+    """Gets the pages of the thread directory.
+
+    Parameters
+    ------------
+    thread_ids_by_parent: dict[int, list[int]]
+        The thread ids to list, grouped by the ids of their parent channels.
+    guild: discord.Guild
+        The guild to get the thread directory for.
+
+    Returns
+    -----------
+    list[list[Embed]]
+        The embeds of every page of the thread directory."""
+    fields: list[tuple[str, str]] = []
+    for parent_id, thread_ids in thread_ids_by_parent.items():
+        fields.extend(pack_lines([f"- <#{thread_id}>" for thread_id in thread_ids], name=f"<#{parent_id}>"))
+    return paginate_fields(
+        fields,
+        title="Thread Directory",
+        description="A list of all threads of this server, sorted by the parent channels of the threads.",
+        color=guild.me.color
+    )
+
+
+def get_page_signature(embeds: list[discord.Embed]) -> str:
+    """Gets a signature of the content of a page, ignoring the timestamps of its embeds.
+
+    Parameters
+    ----------
+    embeds: list[:class:`discord.Embed`]
+        The embeds of the page."""
+    return json.dumps(
+        [{key: value for key, value in embed.to_dict().items() if key != "timestamp"} for embed in embeds],
+        sort_keys=True
+    )
+
+
+directory_index = ThreadDirectoryIndex(DirectoryStore(core.config.database_path))
+directory_writer = ThreadDirectoryWriter(directory_index)
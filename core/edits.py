@@ -0,0 +1,68 @@
+from typing import Any
+
+import discord
+
+__all__ = (
+    "EditBatch",
+    "is_noop_edit",
+)
+
+
+def is_noop_edit(target: discord.abc.Snowflake, field: str, value: Any) -> bool:
+    """Checks whether editing a field of a channel, thread or message wouldn't change anything.
+
+    Fields the check doesn't know are never considered no-ops.
+
+    Parameters
+    ----------
+    target: :class:`discord.abc.Snowflake`
+        The channel, thread or message to edit.
+    field: :class:`str`
+        The name of the field, as passed to ``edit``.
+    value: Any
+        The new value of the field.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the edit can be dropped."""
+    if field == "applied_tags":
+        current = getattr(target, "applied_tags", None)
+        return current is not None and {tag.id for tag in current} == {tag.id for tag in value}
+    if field in ("archived", "auto_archive_duration", "locked", "name", "slowmode_delay", "content"):
+        missing = object()
+        return getattr(target, field, missing) == value
+    return False
+
+
+class EditBatch:
+    """Collects the edits made to channels, threads and messages while handling an event and sends them
+    as a single request per target.
+
+    Later edits of a field override earlier ones, and fields that already have the requested value are dropped
+    when the batch is flushed, so a target whose edits are all no-ops isn't requested at all."""
+
+    def __init__(self) -> None:
+        """Initialises a new, empty edit batch."""
+        self._pending: dict[tuple[type, int], tuple[Any, dict[str, Any]]] = {}
+
+    def edit(self, target: discord.abc.Snowflake, **fields: Any) -> None:
+        """Queues an edit of a target.
+
+        Parameters
+        ----------
+        target: :class:`discord.abc.Snowflake`
+            The channel, thread or message to edit.
+        **fields: Any
+            The fields to edit, as passed to the ``edit`` method of the target."""
+        key = (type(target), target.id)
+        _, pending = self._pending.setdefault(key, (target, {}))
+        pending.update(fields)
+
+    async def flush(self) -> None:
+        """Sends the pending edits, one request per target that still has fields changing."""
+        pending, self._pending = self._pending, {}
+        for target, fields in pending.values():
+            changes = {field: value for field, value in fields.items() if not is_noop_edit(target, field, value)}
+            if changes:
+                await target.edit(**changes)
@@ -263,24 +263,17 @@ class HelpSelectEmbed(GreenEmbed):
 class HelpSelect(discord.ui.Select):
     """Represents a custom PyCord UI help select menu."""
 
-    def __init__(self, cog: Cog) -> None:
+    def __init__(self, menu: "HelpMenu") -> None:
         """Initialises a new help select menu.
 
         Parameters
         ----------
-        cog: :class:`Cog`
-            The cog instance."""
-        self.cog: Cog = cog
+        menu: :class:`HelpMenu`
+            The pre-rendered help menu."""
+        self.menu: HelpMenu = menu
         super().__init__(
             placeholder="Choose a category",
-            options=[
-                discord.SelectOption(
-                    label=cog_name,
-                    description=cog.__doc__,
-                )
-                for cog_name, cog in self.cog.bot.cogs.items()
-                if cog.__cog_commands__ and cog_name not in ["Help"]
-            ],
+            options=menu.options,
         )
 
     async def callback(self, interaction: discord.Interaction) -> None:
@@ -290,14 +283,93 @@ class HelpSelect(discord.ui.Select):
         ----------
         interaction: :class:`discord.Interaction`
             The interaction instance."""
-        cog = self.cog.bot.get_cog(self.values[0])
-        embed = HelpSelectEmbed(cog=cog)
+        embed = self.menu.get_cog_embed(self.values[0])
+        if embed is None:
+            embed = RedEmbed(title="Error", description="This category no longer exists.")
         await interaction.response.send_message(
             embed=embed,
             ephemeral=True,
         )
 
 
+class HelpMenu:
+    """The help embeds and select options, rendered once and reused by every help command.
+
+    The menu is rendered on first use and invalidated whenever a cog is added or removed, so command mentions are
+    only formatted again when the commands changed. Only the live fields of the help embed and the timestamps are
+    refreshed for every use."""
+
+    def __init__(self, bot: AimBot) -> None:
+        """Initialises a new help menu.
+
+        Parameters
+        ----------
+        bot: :class:`AimBot`
+            The bot instance."""
+        self.bot: AimBot = bot
+        self.renders: int = 0
+        self._embed: HelpEmbed | None = None
+        self._options: list[discord.SelectOption] = []
+        self._cog_embeds: dict[str, HelpSelectEmbed] = {}
+
+    def invalidate(self) -> None:
+        """Discards the rendered menu, it is rendered again on its next use."""
+        self._embed = None
+        self._options = []
+        self._cog_embeds = {}
+
+    def render(self) -> None:
+        """Renders the help embed, the select options and the embed of every cog with commands."""
+        self._embed = HelpEmbed(bot=self.bot)
+        cogs = {
+            cog_name: cog for cog_name, cog in self.bot.cogs.items()
+            if cog.__cog_commands__ and cog_name not in ["Help"]
+        }
+        self._options = [
+            discord.SelectOption(label=cog_name, description=cog.__doc__) for cog_name, cog in cogs.items()
+        ]
+        self._cog_embeds = {cog_name: HelpSelectEmbed(cog=cog) for cog_name, cog in cogs.items()}
+        self.renders += 1
+
+    @property
+    def options(self) -> list[discord.SelectOption]:
+        """The options of the help select menu."""
+        if self._embed is None:
+            self.render()
+        return self._options
+
+    def get_embed(self) -> HelpEmbed:
+        """Gets a copy of the help embed with the live fields refreshed."""
+        if self._embed is None:
+            self.render()
+        embed = self._embed.copy()
+        embed.timestamp = discord.utils.utcnow()
+        embed.set_field_at(0, name="Server Count", value=str(len(self.bot.guilds)))
+        embed.set_field_at(1, name="User Count", value=str(len(self.bot.users)))
+        embed.set_field_at(2, name="Ping", value=f"{self.bot.latency * 1000:.2f} ms")
+        return embed
+
+    def get_cog_embed(self, cog_name: str) -> HelpSelectEmbed | None:
+        """Gets a copy of the embed of a cog with the current timestamp.
+
+        Parameters
+        ----------
+        cog_name: :class:`str`
+            The name of the cog.
+
+        Returns
+        -------
+        Optional[:class:`HelpSelectEmbed`]
+            The embed, or ``None`` if the cog no longer exists."""
+        if self._embed is None:
+            self.render()
+        if cog_name not in self._cog_embeds:
+            return None
+        embed = self._cog_embeds[cog_name].copy()
+        embed.timestamp = discord.utils.utcnow()
+        return embed
+
+
 class EmbedToolEmbed(Embed):
     """Represents a custom PyCord embed tool embed."""
 
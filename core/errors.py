@@ -0,0 +1,264 @@
+import asyncio
+import datetime
+import hashlib
+import json
+import traceback
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+import discord
+
+from .layout import (EMBED_CHARACTER_LIMIT, EMBED_FIELD_LIMIT, FENCE, FIELD_NAME_LIMIT, FIELD_VALUE_LIMIT,
+                     TITLE_LIMIT, code_block, fit_fields, pack_text, truncate)
+
+__all__ = (
+    "ErrorEvent",
+    "ErrorReporter",
+    "get_error_embed",
+    "get_error_fingerprint",
+)
+
+# room for the fingerprint footer the reporter adds
+FOOTER_RESERVE = 32
+# the error message is capped well below the description limit, so a long message can't crowd out the traceback
+ERROR_DESCRIPTION_LIMIT = 1024
+# room kept for the innermost part of the traceback and its truncation note, the context fields get the rest
+TRACEBACK_RESERVE = FIELD_VALUE_LIMIT + 64
+
+
+@dataclass
+class ErrorEvent:
+    """Represents an error waiting to be reported.
+
+    Attributes
+    ----------
+    error: :class:`BaseException`
+        The error, with its traceback.
+    fields: list[tuple[:class:`str`, :class:`str`]]
+        The name and value of every context field of the report, like the command or event.
+    occurred_at: :class:`datetime.datetime`
+        When the error occurred."""
+    error: BaseException
+    fields: list[tuple[str, str]]
+    occurred_at: datetime.datetime = field(default_factory=discord.utils.utcnow)
+
+
+def get_error_fingerprint(error: BaseException, *, frames: int = 3) -> str:
+    """Gets a fingerprint identifying an error by its type and the innermost frames of its traceback.
+
+    Parameters
+    ----------
+    error: :class:`BaseException`
+        The error.
+    frames: :class:`int`
+        The number of innermost frames to include.
+
+    Returns
+    -------
+    :class:`str`
+        The fingerprint."""
+    summary = traceback.extract_tb(error.__traceback__)[-frames:] if frames else []
+    frames = [f"{frame.filename}:{frame.lineno}:{frame.name}" for frame in summary]
+    key = "|".join([type(error).__qualname__, *frames])
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+
+def get_error_embed(event: ErrorEvent) -> discord.Embed:
+    """Renders the report of an error into a single embed.
+
+    Tracebacks too long for the embed lose their outermost frames, the innermost ones are always kept. Long
+    messages and context fields are truncated to leave room for them.
+
+    Parameters
+    ----------
+    event: :class:`ErrorEvent`
+        The error to render."""
+    error = event.error
+    title = truncate(error.__class__.__name__, TITLE_LIMIT)
+    description = truncate(str(error), ERROR_DESCRIPTION_LIMIT)
+    context_budget = EMBED_CHARACTER_LIMIT - len(title) - len(description) - FOOTER_RESERVE - TRACEBACK_RESERVE
+    context_fields = []
+    for name, value in event.fields[:EMBED_FIELD_LIMIT - 1]:
+        name = truncate(name, FIELD_NAME_LIMIT)
+        limit = min(FIELD_VALUE_LIMIT, context_budget - len(name))
+        if limit < 1:
+            # the fields that don't fit anymore are dropped
+            break
+        value = truncate(value, limit)
+        context_fields.append((name, value))
+        context_budget -= len(name) + len(value)
+    formatted_error = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+    error_fields = pack_text(formatted_error, name="Error:", code_language="py")
+    # the first kept field may be renamed to the truncation note, which is longer than its name
+    note_reserve = len(f"Error ({len(error_fields)} earlier parts truncated):") - len("Error:")
+    budget = (EMBED_CHARACTER_LIMIT - len(title) - len(description) - FOOTER_RESERVE - note_reserve
+              - sum(len(name) + len(value) for name, value in context_fields))
+    error_fields, dropped = fit_fields(
+        error_fields, max_fields=EMBED_FIELD_LIMIT - len(context_fields), max_characters=budget, keep_end=True
+    )
+    if dropped and error_fields:
+        error_fields[0] = (f"Error ({dropped} earlier parts truncated):", error_fields[0][1])
+    elif dropped:
+        # not even the innermost part fits, keep as much of the end of the traceback as there is room for
+        name = f"Error ({dropped} parts truncated):"
+        limit = min(budget - len(name), FIELD_VALUE_LIMIT)
+        room = limit - len(f"{FENCE}py\n") - len(FENCE)
+        error_fields = [(name, code_block(formatted_error[-room:], language="py", limit=limit) if room > 0 else "…")]
+    error_embed = discord.Embed(title=title, description=description, color=discord.Color.red(),
+                                timestamp=event.occurred_at)
+    for name, value in context_fields:
+        error_embed.add_field(name=name, value=value, inline=True)
+    for name, value in error_fields:
+        error_embed.add_field(name=name, value=value, inline=False)
+    return error_embed
+
+
+class ErrorReporter:
+    """Reports errors to the errors webhook from a background task.
+
+    Errors are put on a bounded queue without waiting, so a failing handler never waits for the webhook. The
+    first occurrence of every error fingerprint is sent right away, repeats are counted and sent as one summary
+    per interval. Reports that can't be sent, because the webhook is unavailable or the queue is full, are
+    appended to a local file instead."""
+
+    def __init__(self, *, spill_path: str, summary_interval: float = 300.0, queue_size: int = 100) -> None:
+        """Initialises a new error reporter.
+
+        Parameters
+        ----------
+        spill_path: :class:`str`
+            The path of the file reports are appended to when they can't be sent.
+        summary_interval: :class:`float`
+            The interval between summaries of repeated errors, in seconds.
+        queue_size: :class:`int`
+            The maximum number of errors waiting to be reported."""
+        self.spill_path: str = spill_path
+        self.summary_interval: float = summary_interval
+        self.queue: asyncio.Queue[ErrorEvent] = asyncio.Queue(maxsize=queue_size)
+        self.sent: int = 0
+        self.folded: int = 0
+        self.spilled: int = 0
+        self._send: Callable[[discord.Embed], Awaitable[object]] | None = None
+        self._repeats: dict[str, tuple[str, int]] = {}
+        self._worker: asyncio.Task | None = None
+
+    def start(self, send: Callable[[discord.Embed], Awaitable[object]]) -> None:
+        """Starts the worker.
+
+        Parameters
+        ----------
+        send: Callable[[:class:`discord.Embed`], Awaitable[object]]
+            The function sending a report to the errors webhook."""
+        self._send = send
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._work())
+
+    def report(self, error: BaseException, fields: list[tuple[str, str]]) -> None:
+        """Queues an error to be reported.
+
+        Parameters
+        ----------
+        error: :class:`BaseException`
+            The error, with its traceback.
+        fields: list[tuple[:class:`str`, :class:`str`]]
+            The name and value of every context field of the report."""
+        event = ErrorEvent(error, fields)
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # formatting the whole report would slow down the handlers flooding the queue even more
+            self.spill({
+                "error": f"{type(error).__name__}: {error}",
+                "fingerprint": get_error_fingerprint(error),
+                "fields": dict(fields)
+            }, reason="queue full")
+
+    async def _work(self) -> None:
+        """Reports queued errors, sending a summary of the repeated ones every interval."""
+        loop = asyncio.get_running_loop()
+        next_summary = loop.time() + self.summary_interval
+        while True:
+            try:
+                event = await asyncio.wait_for(self.queue.get(), max(next_summary - loop.time(), 0))
+            except asyncio.TimeoutError:
+                event = None
+                next_summary = loop.time() + self.summary_interval
+            # the worker is the only one reporting errors, so a report that can't be rendered mustn't stop it
+            try:
+                if event is None:
+                    await self.send_summary()
+                else:
+                    await self.send_event(event)
+            except Exception as error:
+                print(f"Failed to report an error: {type(error).__name__}: {error}")
+
+    async def send_event(self, event: ErrorEvent) -> None:
+        """Sends the report of an error, or counts it for the next summary if its fingerprint was reported already.
+
+        Parameters
+        ----------
+        event: :class:`ErrorEvent`
+            The error to report."""
+        fingerprint = get_error_fingerprint(event.error)
+        if fingerprint in self._repeats:
+            title, count = self._repeats[fingerprint]
+            self._repeats[fingerprint] = (title, count + 1)
+            self.folded += 1
+            return
+        self._repeats[fingerprint] = (f"{type(event.error).__name__}: {event.error}"[:200], 0)
+        embed = get_error_embed(event)
+        embed.set_footer(text=f"Fingerprint {fingerprint}")
+        assert len(embed) <= EMBED_CHARACTER_LIMIT, f"error report is {len(embed)} characters long"
+        await self.send(embed)
+
+    async def send_summary(self) -> None:
+        """Sends the counts of the errors repeated since the last summary.
+
+        Fingerprints without repeats are forgotten, so their next occurrence is reported in full again."""
+        repeated = {fingerprint: entry for fingerprint, entry in self._repeats.items() if entry[1]}
+        self._repeats = {fingerprint: (title, 0) for fingerprint, (title, _) in repeated.items()}
+        if not repeated:
+            return
+        embed = discord.Embed(
+            title="Repeated Errors",
+            description=f"Errors repeated in the last {self.summary_interval / 60:g} minutes:",
+            color=discord.Color.orange(),
+            timestamp=discord.utils.utcnow()
+        )
+        for fingerprint, (title, count) in sorted(repeated.items(), key=lambda item: -item[1][1])[:25]:
+            embed.add_field(name=f"{count}x `{fingerprint}`", value=title or "\u200b", inline=False)
+        await self.send(embed)
+
+    async def send(self, embed: discord.Embed) -> None:
+        """Sends a report to the errors webhook, spilling it to the file if that fails.
+
+        Parameters
+        ----------
+        embed: :class:`discord.Embed`
+            The report."""
+        if self._send is None:
+            self.spill(embed.to_dict(), reason="no webhook")
+            return
+        try:
+            await self._send(embed)
+        except Exception as error:
+            self.spill(embed.to_dict(), reason=f"{type(error).__name__}: {error}")
+            return
+        self.sent += 1
+
+    def spill(self, report: dict, *, reason: str) -> None:
+        """Appends a report to the spill file.
+
+        Parameters
+        ----------
+        report: :class:`dict`
+            The report.
+        reason: :class:`str`
+            Why the report couldn't be sent."""
+        self.spilled += 1
+        record = {"spilled_at": discord.utils.utcnow().isoformat(), "reason": reason, "report": report}
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(record) + "\n")
+        except OSError as error:
+            print(f"Failed to spill error report to {self.spill_path}: {error}")
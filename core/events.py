@@ -0,0 +1,120 @@
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+__all__ = (
+    "event_filter",
+    "EventFilter",
+)
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+
+class EventFilter:
+    """Declarative filter for the object of an event, checked before the handler is scheduled.
+
+    The filter understands messages, channels, threads, members and raw event payloads. Every set criterion has to
+    match, criteria that can't be checked on an event, such as the parent of a message outside a thread, don't
+    match."""
+
+    def __init__(self, *, guild_ids: Iterable[int] | None = None, channel_ids: Iterable[int] | None = None,
+                 parent_ids: Iterable[int] | None = None, exclude_bots: bool = False) -> None:
+        """Initialises a new event filter.
+
+        Parameters
+        ----------
+        guild_ids: Optional[Iterable[:class:`int`]]
+            The IDs of the guilds the event has to come from, events from DMs never match.
+        channel_ids: Optional[Iterable[:class:`int`]]
+            The IDs of the channels the event has to come from.
+        parent_ids: Optional[Iterable[:class:`int`]]
+            The IDs of the parent channels of the thread the event has to come from.
+        exclude_bots: :class:`bool`
+            Whether to drop events caused by bots."""
+        self.guild_ids: frozenset[int] | None = frozenset(guild_ids) if guild_ids is not None else None
+        self.channel_ids: frozenset[int] | None = frozenset(channel_ids) if channel_ids is not None else None
+        self.parent_ids: frozenset[int] | None = frozenset(parent_ids) if parent_ids is not None else None
+        self.exclude_bots: bool = exclude_bots
+        self.passed: int = 0
+        self.filtered: int = 0
+
+    def check(self, *args: Any) -> bool:
+        """Checks whether an event should reach the handler, counting the result.
+
+        Parameters
+        ----------
+        *args: Any
+            The arguments of the event.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the handler should be scheduled."""
+        if self.matches(args[-1] if args else None):
+            self.passed += 1
+            return True
+        self.filtered += 1
+        return False
+
+    def matches(self, obj: Any) -> bool:
+        """Checks whether an event object matches the filter.
+
+        Parameters
+        ----------
+        obj: Any
+            The event object, for events with a before and after state the after state.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the object matches."""
+        if self.exclude_bots:
+            author = getattr(obj, "author", None) or getattr(obj, "user", None) or obj
+            if getattr(author, "bot", False):
+                return False
+        if self.guild_ids is not None and get_guild_id(obj) not in self.guild_ids:
+            return False
+        channel = getattr(obj, "channel", obj)
+        if self.channel_ids is not None:
+            channel_id = getattr(obj, "channel_id", None) or getattr(channel, "id", None)
+            if channel_id not in self.channel_ids:
+                return False
+        if self.parent_ids is not None and getattr(channel, "parent_id", None) not in self.parent_ids:
+            return False
+        return True
+
+
+def get_guild_id(obj: Any) -> int | None:
+    """Gets the ID of the guild an event object belongs to.
+
+    Parameters
+    ----------
+    obj: Any
+        The event object.
+
+    Returns
+    -------
+    Optional[:class:`int`]
+        The ID of the guild, or ``None`` for DMs."""
+    guild_id = getattr(obj, "guild_id", None)
+    if guild_id is not None:
+        return guild_id
+    guild = getattr(obj, "guild", None)
+    return guild.id if guild is not None else None
+
+
+def event_filter(**criteria: Any) -> Callable[[T], T]:
+    """Decorator attaching an :class:`EventFilter` to an event listener.
+
+    Events not matching the filter are dropped by :meth:`core.AimBot._schedule_event` before a coroutine is
+    created for the listener.
+
+    Parameters
+    ----------
+    **criteria: Any
+        The criteria of the filter, see :class:`EventFilter`."""
+
+    def decorator(func: T) -> T:
+        func.__event_filter__ = EventFilter(**criteria)
+        return func
+
+    return decorator
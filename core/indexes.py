@@ -0,0 +1,170 @@
+import discord
+
+import core
+
+__all__ = (
+    "role_member_index",
+    "RoleMemberIndex",
+    "thread_owner_index",
+    "ThreadOwnerIndex",
+)
+
+
+class RoleMemberIndex:
+    """Per-guild index of the members of the ping roles.
+
+    The index is built once at ready and kept up to date from member events, so the members of a ping role
+    can be listed in O(role size) instead of scanning every member of the guild."""
+
+    def __init__(self) -> None:
+        """Initialises a new, empty role member index."""
+        self._members: dict[int, dict[int, set[int]]] = {}
+
+    def build(self, guild: discord.Guild) -> None:
+        """Builds the index of a guild from its cached members.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild to build the index of."""
+        role_ids = self.tracked_role_ids(guild.id)
+        members: dict[int, set[int]] = {role_id: set() for role_id in role_ids}
+        for member in guild.members:
+            for role_id in role_ids:
+                if member.get_role(role_id) is not None:
+                    members[role_id].add(member.id)
+        self._members[guild.id] = members
+
+    def get(self, guild: discord.Guild, role: discord.Role) -> set[int]:
+        """Gets the IDs of the members of a role, building the index of the guild first if needed.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild of the role.
+        role: :class:`discord.Role`
+            The role to get the members of.
+
+        Returns
+        -------
+        set[:class:`int`]
+            The IDs of the members of the role."""
+        if guild.id not in self._members:
+            self.build(guild)
+        if role.id not in self._members[guild.id]:
+            return {member.id for member in role.members}
+        return self._members[guild.id][role.id]
+
+    def handle_member_join(self, member: discord.Member) -> None:
+        """Adds a member that joined a guild to the roles they already have.
+
+        Parameters
+        ----------
+        member: :class:`discord.Member`
+            The member that joined."""
+        for role_id, members in self._members.get(member.guild.id, {}).items():
+            if member.get_role(role_id) is not None:
+                members.add(member.id)
+
+    def handle_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        """Updates the roles of a member.
+
+        Parameters
+        ----------
+        before: :class:`discord.Member`
+            The member before the update.
+        after: :class:`discord.Member`
+            The member after the update."""
+        for role_id, members in self._members.get(after.guild.id, {}).items():
+            if after.get_role(role_id) is not None:
+                members.add(after.id)
+            else:
+                members.discard(after.id)
+
+    def handle_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        """Removes a member that left a guild from all roles.
+
+        Parameters
+        ----------
+        payload: :class:`discord.RawMemberRemoveEvent`
+            The payload for the member that left."""
+        for members in self._members.get(payload.guild_id, {}).values():
+            members.discard(payload.user.id)
+
+    @staticmethod
+    def tracked_role_ids(guild_id: int) -> set[int]:
+        """Gets the IDs of the roles tracked in a guild.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild."""
+        ping_role_id = core.config.ping_roles.get(guild_id)
+        return {ping_role_id} if ping_role_id is not None else set()
+
+
+class ThreadOwnerIndex:
+    """Per-guild index of the threads owned by every member.
+
+    The index is kept up to date from thread create, update, join and delete events and the archived thread sweep
+    of the startup reconciliation, so the threads of a member can be found without scanning every thread. Update
+    and join events also cover threads the sweep missed, like archived threads that are unarchived later."""
+
+    def __init__(self) -> None:
+        """Initialises a new, empty thread owner index."""
+        self._threads: dict[int, dict[int, set[int]]] = {}
+        self._owners: dict[int, int] = {}
+
+    def add(self, thread: discord.Thread) -> None:
+        """Adds a thread to the index.
+
+        Parameters
+        ----------
+        thread: :class:`discord.Thread`
+            The thread to add."""
+        if thread.owner_id is None:
+            return
+        self._threads.setdefault(thread.guild.id, {}).setdefault(thread.owner_id, set()).add(thread.id)
+        self._owners[thread.id] = thread.owner_id
+
+    def remove(self, guild_id: int, thread_id: int) -> None:
+        """Removes a thread from the index.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild of the thread.
+        thread_id: :class:`int`
+            The ID of the thread to remove."""
+        owner_id = self._owners.pop(thread_id, None)
+        if owner_id is None:
+            return
+        owned = self._threads.get(guild_id, {}).get(owner_id)
+        if owned is None:
+            return
+        owned.discard(thread_id)
+        if not owned:
+            del self._threads[guild_id][owner_id]
+
+    def pop(self, guild_id: int, owner_id: int) -> set[int]:
+        """Removes all threads of an owner from the index.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        owner_id: :class:`int`
+            The ID of the owner.
+
+        Returns
+        -------
+        set[:class:`int`]
+            The IDs of the threads of the owner."""
+        thread_ids = self._threads.get(guild_id, {}).pop(owner_id, set())
+        for thread_id in thread_ids:
+            self._owners.pop(thread_id, None)
+        return thread_ids
+
+
+role_member_index = RoleMemberIndex()
+thread_owner_index = ThreadOwnerIndex()
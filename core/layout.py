@@ -0,0 +1,260 @@
+import datetime
+import itertools
+from collections.abc import Iterable
+
+import discord
+
+__all__ = (
+    "code_block",
+    "fit_fields",
+    "pack_lines",
+    "pack_text",
+    "paginate_fields",
+    "truncate",
+)
+
+TITLE_LIMIT = 256
+DESCRIPTION_LIMIT = 4096
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+FOOTER_LIMIT = 2048
+EMBED_FIELD_LIMIT = 25
+EMBED_CHARACTER_LIMIT = 6000
+MESSAGE_EMBED_LIMIT = 10
+
+FENCE = "```"
+# room for the fence closing a code block that is split across fields
+CLOSING_FENCE_LENGTH = len("\n" + FENCE)
+# longest fence reopening a split code block, fence languages are cut to this length
+REOPENING_FENCE_LIMIT = 16
+
+
+def truncate(text: str, limit: int, *, placeholder: str = "…") -> str:
+    """Truncates text to a length limit.
+
+    Parameters
+    ----------
+    text: :class:`str`
+        The text to truncate.
+    limit: :class:`int`
+        The maximum length of the text.
+    placeholder: :class:`str`
+        The placeholder ending truncated text.
+
+    Returns
+    -------
+    :class:`str`
+        The text, truncated if it was longer than the limit."""
+    if len(text) <= limit:
+        return text
+    return text[:limit - len(placeholder)] + placeholder
+
+
+def escape_fences(text: str) -> str:
+    """Breaks up the code fences in text, so it can be put in a code block.
+
+    Parameters
+    ----------
+    text: :class:`str`
+        The text to escape."""
+    return text.replace(FENCE, "`\u200b``")
+
+
+def code_block(text: str, *, language: str = "", limit: int = FIELD_VALUE_LIMIT) -> str:
+    """Puts text in a code block, truncating the text so the whole block fits the limit.
+
+    Parameters
+    ----------
+    text: :class:`str`
+        The text to put in the code block.
+    language: :class:`str`
+        The language of the code block.
+    limit: :class:`int`
+        The maximum length of the code block.
+
+    Returns
+    -------
+    :class:`str`
+        The code block."""
+    opening = f"{FENCE}{language}\n"
+    return f"{opening}{truncate(escape_fences(text), limit - len(opening) - len(FENCE))}{FENCE}"
+
+
+def pack_lines(lines: Iterable[str], *, name: str = "", code_language: str | None = None,
+               limit: int = FIELD_VALUE_LIMIT) -> list[tuple[str, str]]:
+    """Packs lines into as few embed fields as possible in a single pass.
+
+    Lines longer than a field are split. Code blocks stay balanced: a code block split across fields is closed at
+    the end of the field and reopened with the same language in the next one.
+
+    Parameters
+    ----------
+    lines: Iterable[:class:`str`]
+        The lines to pack.
+    name: :class:`str`
+        The name of the first field. Following fields are unnamed.
+    code_language: Optional[:class:`str`]
+        The language of the code block to put all lines in, or ``None`` to pack them as they are.
+    limit: :class:`int`
+        The maximum length of a field value.
+
+    Returns
+    -------
+    list[tuple[:class:`str`, :class:`str`]]
+        The name and value of every field."""
+    if code_language is not None:
+        lines = itertools.chain(
+            [FENCE + code_language[:REOPENING_FENCE_LIMIT - len(FENCE)]],
+            (escape_fences(line) for line in lines),
+            [FENCE]
+        )
+    # every piece of a line has to fit into a field together with a reopening and a closing fence
+    piece_limit = limit - REOPENING_FENCE_LIMIT - 1 - CLOSING_FENCE_LENGTH
+    values: list[str] = []
+    buffer: list[str] = []
+    length = -1
+    fence: str | None = None
+    reopened = False
+
+    def flush() -> None:
+        nonlocal buffer, length, reopened
+        if fence is not None:
+            buffer.append(FENCE)
+        values.append("\n".join(buffer))
+        buffer = [fence] if fence is not None else []
+        length = len(fence) if fence is not None else -1
+        reopened = fence is not None
+
+    for line in lines:
+        toggles = line.count(FENCE) % 2 == 1
+        # a field only needs room for a closing fence while a code block is open after the line
+        if fence is not None and toggles and line.strip() == FENCE:
+            reserve = 0
+        else:
+            reserve = CLOSING_FENCE_LENGTH if fence is not None or toggles else 0
+        for start in range(0, max(len(line), 1), piece_limit):
+            piece = line[start:start + piece_limit]
+            if buffer and not reopened and length + 1 + len(piece) + reserve > limit:
+                flush()
+            buffer.append(piece)
+            length += 1 + len(piece)
+            reopened = False
+        if toggles:
+            if fence is None:
+                language = line[line.rfind(FENCE) + len(FENCE):].strip().split(" ")[0]
+                fence = FENCE + language[:REOPENING_FENCE_LIMIT - len(FENCE)]
+            else:
+                fence = None
+    if buffer and not reopened:
+        flush()
+    name = truncate(name, FIELD_NAME_LIMIT)
+    return [(name if i == 0 else "", value or "\u200b") for i, value in enumerate(values)]
+
+
+def pack_text(text: str, *, name: str = "", code_language: str | None = None,
+              limit: int = FIELD_VALUE_LIMIT) -> list[tuple[str, str]]:
+    """Packs text into as few embed fields as possible, see :func:`pack_lines`.
+
+    Parameters
+    ----------
+    text: :class:`str`
+        The text to pack.
+    name: :class:`str`
+        The name of the first field. Following fields are unnamed.
+    code_language: Optional[:class:`str`]
+        The language of the code block to put the text in, or ``None`` to pack it as it is.
+    limit: :class:`int`
+        The maximum length of a field value.
+
+    Returns
+    -------
+    list[tuple[:class:`str`, :class:`str`]]
+        The name and value of every field."""
+    return pack_lines(text.rstrip("\n").split("\n"), name=name, code_language=code_language, limit=limit)
+
+
+def fit_fields(fields: list[tuple[str, str]], *, max_fields: int = EMBED_FIELD_LIMIT,
+               max_characters: int = EMBED_CHARACTER_LIMIT, keep_end: bool = False
+               ) -> tuple[list[tuple[str, str]], int]:
+    """Drops fields until the rest fit into a field and character budget.
+
+    Parameters
+    ----------
+    fields: list[tuple[:class:`str`, :class:`str`]]
+        The name and value of every field.
+    max_fields: :class:`int`
+        The maximum number of fields to keep.
+    max_characters: :class:`int`
+        The maximum number of characters of the kept fields.
+    keep_end: :class:`bool`
+        Whether to keep the last fields instead of the first ones.
+
+    Returns
+    -------
+    tuple[list[tuple[:class:`str`, :class:`str`]], :class:`int`]
+        The kept fields and the number of dropped fields."""
+    ordered = reversed(fields) if keep_end else fields
+    kept: list[tuple[str, str]] = []
+    characters = 0
+    for name, value in ordered:
+        if len(kept) == max_fields or characters + len(name) + len(value) > max_characters:
+            break
+        kept.append((name, value))
+        characters += len(name) + len(value)
+    if keep_end:
+        kept.reverse()
+    return kept, len(fields) - len(kept)
+
+
+def paginate_fields(fields: Iterable[tuple[str, str]], *, title: str = "", description: str = "",
+                    color: discord.Color | None = None, footer: str = "",
+                    timestamp: datetime.datetime | None = None) -> list[list[discord.Embed]]:
+    """Paginates fields into embeds and messages in a single pass, within all of Discord's embed limits.
+
+    Parameters
+    ----------
+    fields: Iterable[tuple[:class:`str`, :class:`str`]]
+        The name and value of every field, at most 256 and 1024 characters long.
+    title: :class:`str`
+        The title of the first embed.
+    description: :class:`str`
+        The description of the first embed.
+    color: Optional[:class:`discord.Color`]
+        The color of the embeds.
+    footer: :class:`str`
+        The footer of the last embed.
+    timestamp: Optional[:class:`datetime.datetime`]
+        The timestamp of the embeds, defaults to now.
+
+    Returns
+    -------
+    list[list[:class:`discord.Embed`]]
+        The embeds of every page, one page per message."""
+    if timestamp is None:
+        timestamp = discord.utils.utcnow()
+    title = truncate(title, TITLE_LIMIT)
+    description = truncate(description, DESCRIPTION_LIMIT)
+    footer = truncate(footer, FOOTER_LIMIT)
+    embed = discord.Embed(title=title or None, description=description or None, color=color, timestamp=timestamp)
+    pages: list[list[discord.Embed]] = [[embed]]
+    embed_length = message_length = len(title) + len(description) + len(footer)
+    for name, value in fields:
+        length = len(name) + len(value)
+        embed_full = len(embed.fields) == EMBED_FIELD_LIMIT or embed_length + length > EMBED_CHARACTER_LIMIT
+        message_full = message_length + length > EMBED_CHARACTER_LIMIT or (
+            embed_full and len(pages[-1]) == MESSAGE_EMBED_LIMIT
+        )
+        if message_full:
+            embed = discord.Embed(color=color, timestamp=timestamp)
+            pages.append([embed])
+            embed_length = message_length = len(footer)
+        elif embed_full:
+            embed = discord.Embed(color=color, timestamp=timestamp)
+            pages[-1].append(embed)
+            embed_length = len(footer)
+        embed.add_field(name=name, value=value, inline=False)
+        embed_length += length
+        message_length += length
+    if footer:
+        embed.set_footer(text=footer)
+    return pages
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = (
+    "run_steps",
+    "Step",
+)
+
+
+@dataclass(frozen=True)
+class Step:
+    """Represents a step of handling a thread lifecycle event.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the step, used to refer to it and in the timings.
+    run: Callable[[], Awaitable[Any]]
+        The function running the step.
+    after: tuple[:class:`str`, ...]
+        The names of the steps that have to finish before this step can start."""
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    after: tuple[str, ...] = ()
+
+
+async def run_steps(label: str, *steps: Step) -> dict[str, float]:
+    """Runs steps concurrently, starting every step as soon as the steps it depends on have finished, and prints
+    how long every step took.
+
+    A step whose dependency failed is skipped. The first error is raised once every other step has finished.
+
+    Parameters
+    ----------
+    label: :class:`str`
+        The label of the run, used in the timings.
+    *steps: :class:`Step`
+        The steps to run.
+
+    Returns
+    -------
+    dict[:class:`str`, :class:`float`]
+        The time every finished step took after the start of the run, in seconds."""
+    start = time.perf_counter()
+    names = {step.name for step in steps}
+    for step in steps:
+        if unknown := set(step.after) - names:
+            raise ValueError(f"Step {step.name!r} depends on unknown steps {sorted(unknown)}")
+    tasks: dict[str, asyncio.Task] = {}
+    finished: dict[str, float] = {}
+
+    async def run_step(step: Step) -> None:
+        for name in step.after:
+            # a failed dependency raises here, skipping this step
+            await asyncio.shield(tasks[name])
+        await step.run()
+        finished[step.name] = time.perf_counter() - start
+
+    for step in steps:
+        tasks[step.name] = asyncio.create_task(run_step(step))
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    timings = ", ".join(f"{name} {elapsed * 1000:.0f} ms" for name, elapsed in finished.items())
+    print(f"{label}: {timings or 'no steps finished'}")
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return finished
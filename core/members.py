@@ -0,0 +1,129 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+import discord
+
+__all__ = (
+    "add_thread_members",
+    "MemberAddReport",
+    "pack_mentions",
+)
+
+MESSAGE_CONTENT_LIMIT = 2000
+
+
+@dataclass
+class MemberAddReport:
+    """Represents the result of adding members to a thread.
+
+    Attributes
+    ----------
+    strategy: :class:`str`
+        The strategy used to add the members.
+    members: :class:`int`
+        The number of members added.
+    rest_calls: :class:`int`
+        The number of REST calls used.
+    elapsed: :class:`float`
+        The time it took to add the members, in seconds."""
+    strategy: str
+    members: int
+    rest_calls: int = 0
+    elapsed: float = 0.0
+
+
+def pack_mentions(member_ids: list[int] | set[int]) -> list[str]:
+    """Packs member mentions into as few message contents as possible.
+
+    Parameters
+    ----------
+    member_ids: Union[list[:class:`int`], set[:class:`int`]]
+        The IDs of the members to mention.
+
+    Returns
+    -------
+    list[:class:`str`]
+        The message contents, each at most 2000 characters long."""
+    contents: list[str] = []
+    content = ""
+    for member_id in member_ids:
+        mention = f"<@{member_id}> "
+        if len(content) + len(mention) > MESSAGE_CONTENT_LIMIT:
+            contents.append(content)
+            content = ""
+        content += mention
+    if content:
+        contents.append(content)
+    return contents
+
+
+async def add_thread_members(thread: discord.Thread, ping_msg: discord.Message, member_ids: list[int] | set[int], *,
+                             strategy: str = "pack", concurrency: int = 4) -> MemberAddReport:
+    """Adds members to a thread.
+
+    Strategies
+    ----------
+    ``pack``
+        Edits the mentions into the ping message, packing as many mentions into every edit as fit.
+    ``parallel``
+        Like ``pack``, but spreads the edits across ``concurrency`` ping messages edited concurrently.
+        The additional ping messages are deleted afterwards.
+    ``direct``
+        Adds every member through the thread member endpoint, ``concurrency`` at a time.
+
+    Parameters
+    ----------
+    thread: :class:`discord.Thread`
+        The thread to add the members to.
+    ping_msg: :class:`discord.Message`
+        The message to edit the mentions into.
+    member_ids: Union[list[:class:`int`], set[:class:`int`]]
+        The IDs of the members to add.
+    strategy: :class:`str`
+        The strategy to use.
+    concurrency: :class:`int`
+        The number of concurrent requests used by the ``parallel`` and ``direct`` strategies.
+
+    Returns
+    -------
+    :class:`MemberAddReport`
+        The report of the run."""
+    report = MemberAddReport(strategy=strategy, members=len(member_ids))
+    start = time.perf_counter()
+    if strategy == "direct":
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add_user(member_id: int) -> None:
+            async with semaphore:
+                await thread.add_user(discord.Object(member_id))
+                report.rest_calls += 1
+
+        await asyncio.gather(*(add_user(member_id) for member_id in member_ids))
+    elif strategy == "parallel":
+        contents = pack_mentions(member_ids)
+        ping_msgs = [ping_msg]
+        for _ in range(min(concurrency, len(contents)) - 1):
+            ping_msgs.append(await thread.send("⠀", silent=True))
+            report.rest_calls += 1
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for content in contents:
+            queue.put_nowait(content)
+
+        async def edit_mentions(message: discord.Message) -> None:
+            while not queue.empty():
+                await message.edit(content=queue.get_nowait())
+                report.rest_calls += 1
+
+        await asyncio.gather(*(edit_mentions(message) for message in ping_msgs))
+        for message in ping_msgs[1:]:
+            await message.delete()
+            report.rest_calls += 1
+    elif strategy == "pack":
+        for content in pack_mentions(member_ids):
+            await ping_msg.edit(content=content)
+            report.rest_calls += 1
+    else:
+        raise ValueError(f"Unknown member adding strategy {strategy!r}")
+    report.elapsed = time.perf_counter() - start
+    return report
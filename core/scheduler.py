@@ -0,0 +1,284 @@
+import asyncio
+import contextlib
+import contextvars
+import enum
+import heapq
+import itertools
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+import aiohttp
+from discord.http import Route
+
+__all__ = (
+    "current_lane",
+    "Lane",
+    "rest_lane",
+    "RestScheduler",
+    "RouteBucket",
+)
+
+
+class Lane(enum.IntEnum):
+    """The priority lanes of outbound REST requests, lower values go first.
+
+    ``INTERACTION`` is the lane of the requests a command makes while it handles an interaction. The interaction
+    responses themselves, including deferrals, modals and followups, are sent through discord's webhook adapter
+    instead of :meth:`discord.http.HTTPClient.request`, so they are never scheduled. They don't count towards the
+    global rate limit of the bot, so they never wait behind scheduled requests either."""
+    INTERACTION = 0
+    USER_VISIBLE = 1
+    BACKGROUND = 2
+
+
+current_lane: contextvars.ContextVar[Lane] = contextvars.ContextVar("current_lane", default=Lane.USER_VISIBLE)
+current_route: contextvars.ContextVar[str | None] = contextvars.ContextVar("current_route", default=None)
+
+
+@contextlib.contextmanager
+def rest_lane(lane: Lane) -> Iterator[None]:
+    """Runs the REST requests made inside the block, and the tasks created inside it, in a lane.
+
+    Parameters
+    ----------
+    lane: :class:`Lane`
+        The lane to use."""
+    token = current_lane.set(lane)
+    try:
+        yield
+    finally:
+        current_lane.reset(token)
+
+
+class RouteBucket:
+    """Token bucket of a single route, filled from the rate limit headers of its responses.
+
+    Until the first response has been observed the limit is unknown and requests aren't held back."""
+
+    def __init__(self) -> None:
+        """Initialises a new bucket with an unknown limit."""
+        self.limit: int | None = None
+        self.remaining: int = 0
+        self.reset_at: float = 0.0
+        self.window: float = 0.0
+
+    def refill(self, now: float) -> None:
+        """Refills the bucket to its limit if its reset time has passed, assuming the next window is as long
+        as the longest one observed.
+
+        Parameters
+        ----------
+        now: :class:`float`
+            The current monotonic time."""
+        if self.limit is not None and self.reset_at <= now:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+
+    def delay(self, now: float) -> float:
+        """Gets the time until the bucket has a token.
+
+        Parameters
+        ----------
+        now: :class:`float`
+            The current monotonic time."""
+        self.refill(now)
+        if self.limit is None or self.remaining > 0:
+            return 0.0
+        return self.reset_at - now
+
+    def consume(self) -> None:
+        """Takes a token from the bucket."""
+        if self.limit is not None:
+            self.remaining -= 1
+
+    def update(self, headers: Any, now: float) -> None:
+        """Updates the bucket from the rate limit headers of a response.
+
+        Parameters
+        ----------
+        headers: Mapping[:class:`str`, :class:`str`]
+            The headers of the response.
+        now: :class:`float`
+            The current monotonic time."""
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_after = float(headers["X-RateLimit-Reset-After"])
+        except (KeyError, ValueError):
+            return
+        reset_at = now + reset_after
+        if self.limit is not None and abs(reset_at - self.reset_at) < 1:
+            # responses of the same window can arrive out of order, keep the lowest count seen
+            remaining = min(remaining, self.remaining)
+        self.limit = limit
+        self.remaining = remaining
+        self.reset_at = reset_at
+        # the header is the time left in the window, it is only the full window on its first response
+        self.window = max(self.window, reset_after)
+
+
+class RestScheduler:
+    """Schedules the outbound REST requests of the bot.
+
+    Every route has a :class:`RouteBucket` that is filled ahead of time from the rate limit headers Discord sends,
+    so requests wait for their bucket to reset instead of running into 429s. On top of that a global token bucket
+    keeps the bot below the global rate limit, holding back a reserve that background requests can't use.
+
+    Waiting requests are served in lane order, so background maintenance never delays the requests of commands or
+    user visible edits. Interaction responses bypass the scheduler, see :class:`Lane`."""
+
+    def __init__(self, *, global_rate: int = 50, background_reserve: int = 10) -> None:
+        """Initialises a new REST scheduler.
+
+        Parameters
+        ----------
+        global_rate: :class:`int`
+            The number of requests allowed per second across all routes.
+        background_reserve: :class:`int`
+            The number of global tokens background requests leave for the other lanes."""
+        self.global_rate: int = global_rate
+        self.background_reserve: int = background_reserve
+        self.buckets: dict[str, RouteBucket] = {}
+        self.requests: Counter[Lane] = Counter()
+        self.waited: Counter[Lane] = Counter()
+        self.trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        self.trace_config.on_request_end.append(self._on_request_end)
+        self.trace_config.freeze()
+        self._tokens: float = float(global_rate)
+        self._refilled_at: float = time.monotonic()
+        self._queues: dict[str, list[tuple[Lane, int]]] = {}
+        self._global_waiters: set[tuple[Lane, int]] = set()
+        self._wakeups: dict[tuple[Lane, int], asyncio.Event] = {}
+        self._sequence = itertools.count()
+
+    def wrap(self, request: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """Wraps :meth:`discord.http.HTTPClient.request` to schedule every request before it is made.
+
+        Parameters
+        ----------
+        request: Callable[..., Awaitable[Any]]
+            The request method to wrap."""
+
+        async def scheduled_request(route: Route, **kwargs: Any) -> Any:
+            key = f"{route.method} {route.bucket}"
+            await self.acquire(key, current_lane.get())
+            token = current_route.set(key)
+            try:
+                return await request(route, **kwargs)
+            finally:
+                current_route.reset(token)
+
+        return scheduled_request
+
+    async def acquire(self, key: str, lane: Lane) -> None:
+        """Waits until a request may be made on a route.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the route.
+        lane: :class:`Lane`
+            The lane of the request."""
+        waiter = (lane, next(self._sequence))
+        heapq.heappush(self._queues.setdefault(key, []), waiter)
+        wakeup = self._wakeups[waiter] = asyncio.Event()
+        self.requests[lane] += 1
+        waited = False
+        try:
+            while True:
+                wakeup.clear()
+                if (delay := self._delay(key, waiter)) == 0:
+                    break
+                waited = True
+                try:
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # a cancelled waiter may have been the head of its queue, the next one mustn't wait for its timeout
+            self._remove_waiter(key, waiter)
+            self._notify(key)
+        self.buckets.setdefault(key, RouteBucket()).consume()
+        self._tokens -= 1
+        if waited:
+            self.waited[lane] += 1
+
+    def _remove_waiter(self, key: str, waiter: tuple[Lane, int]) -> None:
+        """Removes a waiter from the queue of its route.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the route.
+        waiter: tuple[:class:`Lane`, :class:`int`]
+            The waiter."""
+        self._global_waiters.discard(waiter)
+        del self._wakeups[waiter]
+        queue = self._queues[key]
+        queue.remove(waiter)
+        heapq.heapify(queue)
+        if not queue:
+            del self._queues[key]
+
+    def _delay(self, key: str, waiter: tuple[Lane, int]) -> float | None:
+        """Gets the time until a waiter may make its request.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the route.
+        waiter: tuple[:class:`Lane`, :class:`int`]
+            The waiter.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The delay in seconds, or ``None`` if the waiter has to wait for another request first."""
+        if self._queues[key][0] != waiter:
+            return None
+        now = time.monotonic()
+        route_delay = self.buckets.setdefault(key, RouteBucket()).delay(now)
+        if route_delay > 0:
+            # a waiter held back by its route mustn't hold back the global waiters after it
+            if waiter in self._global_waiters:
+                self._global_waiters.discard(waiter)
+                self._notify()
+            return route_delay
+        self._tokens = min(self.global_rate, self._tokens + (now - self._refilled_at) * self.global_rate)
+        self._refilled_at = now
+        reserve = self.background_reserve if waiter[0] is Lane.BACKGROUND else 0
+        if any(other < waiter for other in self._global_waiters):
+            # woken once the global waiters before it have made their requests
+            self._global_waiters.add(waiter)
+            return None
+        if self._tokens >= 1 + reserve:
+            self._global_waiters.discard(waiter)
+            return 0.0
+        self._global_waiters.add(waiter)
+        return max(1 + reserve - self._tokens, 1) / self.global_rate
+
+    def _notify(self, key: str | None = None) -> None:
+        """Wakes up the waiters that may be able to make their request now, instead of every waiting request.
+
+        Only the head of a route queue can be made and only the first global waiter can take a global token, so
+        these are the only waiters woken. The others are woken once they move up.
+
+        Parameters
+        ----------
+        key: Optional[:class:`str`]
+            The key of the route whose bucket or queue changed, if any."""
+        if key is not None and (queue := self._queues.get(key)):
+            self._wakeups[queue[0]].set()
+        if self._global_waiters:
+            self._wakeups[min(self._global_waiters)].set()
+
+    async def _on_request_end(self, session: aiohttp.ClientSession, context: Any,
+                              params: aiohttp.TraceRequestEndParams) -> None:
+        """Updates the bucket of the current route from the headers of its response."""
+        key = current_route.get()
+        if key is None:
+            return
+        self.buckets.setdefault(key, RouteBucket()).update(params.response.headers, time.monotonic())
+        self._notify(key)
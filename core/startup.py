@@ -0,0 +1,108 @@
+import importlib
+import sys
+import time
+from types import ModuleType
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+__all__ = (
+    "LazyModule",
+    "startup_report",
+    "StartupReport",
+)
+
+# core is the first thing main.py imports, so this is as close to the start of the process as the bot can measure
+process_started_at: float = time.perf_counter()
+
+
+def get_peak_memory() -> float | None:
+    """Gets the peak resident memory of the process in MiB, or ``None`` if the platform doesn't report it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kibibytes
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+class StartupReport:
+    """Timings of the startup of the bot, measured from :data:`process_started_at`.
+
+    Attributes
+    ----------
+    cogs: dict[:class:`str`, tuple[:class:`float`, :class:`float`]]
+        The import and setup time of every loaded cog, in seconds.
+    lazy_imports: dict[:class:`str`, :class:`float`]
+        The import time of every lazily imported module, in seconds.
+    milestones: dict[:class:`str`, tuple[:class:`float`, Optional[:class:`float`]]]
+        The time from the start of the process to every milestone in seconds, and the peak resident memory at the
+        milestone in MiB."""
+
+    def __init__(self) -> None:
+        """Initialises a new startup report."""
+        self.cogs: dict[str, tuple[float, float]] = {}
+        self.lazy_imports: dict[str, float] = {}
+        self.milestones: dict[str, tuple[float, float | None]] = {}
+
+    def mark(self, milestone: str) -> None:
+        """Records the first time a milestone is reached.
+
+        Parameters
+        ----------
+        milestone: :class:`str`
+            The name of the milestone."""
+        if milestone not in self.milestones:
+            self.milestones[milestone] = (time.perf_counter() - process_started_at, get_peak_memory())
+
+    def format(self) -> str:
+        """Formats the report for the console."""
+        lines = ["Startup report:"]
+        for milestone, (elapsed, peak_memory) in self.milestones.items():
+            memory = f"{peak_memory:>10.1f} MiB peak" if peak_memory is not None else ""
+            lines.append(f"    {milestone:<32}{elapsed * 1000:>10.1f} ms{memory}")
+        if self.cogs:
+            lines.append(f"    {'cog':<32}{'import':>10}{'setup':>10}")
+            for cog, (import_time, setup_time) in sorted(self.cogs.items(), key=lambda item: -sum(item[1])):
+                lines.append(f"    {cog:<32}{import_time * 1000:>7.1f} ms{setup_time * 1000:>7.1f} ms")
+        for module, import_time in self.lazy_imports.items():
+            lines.append(f"    {'lazy ' + module:<32}{import_time * 1000:>7.1f} ms")
+        return "\n".join(lines)
+
+
+class LazyModule:
+    """Module imported on first attribute access.
+
+    Lets a cog register its commands right away while deferring the import of its UI classes to their first use.
+    The import time is recorded in :data:`startup_report`."""
+
+    def __init__(self, name: str) -> None:
+        """Initialises a new lazy module.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The absolute name of the module."""
+        self.name: str = name
+        self._module: ModuleType | None = None
+
+    def load(self) -> ModuleType:
+        """Imports the module if it hasn't been imported yet.
+
+        Returns
+        -------
+        :class:`types.ModuleType`
+            The module."""
+        if self._module is None:
+            start = time.perf_counter()
+            self._module = importlib.import_module(self.name)
+            startup_report.lazy_imports[self.name] = time.perf_counter() - start
+        return self._module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+
+startup_report = StartupReport()
@@ -0,0 +1,152 @@
+import datetime
+import sqlite3
+
+__all__ = (
+    "DirectoryStore",
+)
+
+
+class DirectoryStore:
+    """SQLite-backed store for the thread directory entries.
+
+    The connection is opened lazily on first use. Writes aren't committed on their own, wrap them in
+    :meth:`transaction` to commit a batch of writes at once."""
+
+    def __init__(self, path: str) -> None:
+        """Initialises a new directory store.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the SQLite database file."""
+        self.path: str = path
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection to the database, opened and set up on first access."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            with self._connection:
+                self._connection.executescript("""
+                    CREATE TABLE IF NOT EXISTS directory_entries (
+                        thread_id INTEGER NOT NULL UNIQUE,
+                        guild_id INTEGER NOT NULL,
+                        parent_id INTEGER NOT NULL,
+                        waiting_since REAL
+                    );
+                    CREATE TABLE IF NOT EXISTS migrated_guilds (
+                        guild_id INTEGER PRIMARY KEY
+                    );
+                    CREATE TABLE IF NOT EXISTS directory_pages (
+                        guild_id INTEGER NOT NULL,
+                        page INTEGER NOT NULL,
+                        message_id INTEGER NOT NULL,
+                        PRIMARY KEY (guild_id, page)
+                    );
+                """)
+        return self._connection
+
+    def transaction(self) -> sqlite3.Connection:
+        """Gets a context manager committing the writes inside it, or rolling them back on errors."""
+        return self.connection
+
+    def load_entries(self) -> list[tuple[int, int, int, datetime.datetime | None]]:
+        """Loads all directory entries in the order they were added.
+
+        Returns
+        -------
+        list[tuple[:class:`int`, :class:`int`, :class:`int`, Optional[:class:`datetime.datetime`]]]
+            The guild ID, thread ID, parent ID and waiting since time of every entry."""
+        rows = self.connection.execute(
+            "SELECT guild_id, thread_id, parent_id, waiting_since FROM directory_entries ORDER BY rowid"
+        ).fetchall()
+        return [
+            (guild_id, thread_id, parent_id, to_datetime(waiting_since))
+            for guild_id, thread_id, parent_id, waiting_since in rows
+        ]
+
+    def load_migrated_guilds(self) -> set[int]:
+        """Loads the IDs of the guilds whose directory has been migrated to the store."""
+        return {guild_id for guild_id, in self.connection.execute("SELECT guild_id FROM migrated_guilds")}
+
+    def add_entry(self, guild_id: int, thread_id: int, parent_id: int,
+                  waiting_since: datetime.datetime | None) -> None:
+        """Adds a directory entry, replacing an existing entry of the same thread.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild of the thread.
+        thread_id: :class:`int`
+            The ID of the thread.
+        parent_id: :class:`int`
+            The ID of the parent channel of the thread.
+        waiting_since: Optional[:class:`datetime.datetime`]
+            When the thread started waiting for feedback."""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO directory_entries (thread_id, guild_id, parent_id, waiting_since) "
+            "VALUES (?, ?, ?, ?)",
+            (thread_id, guild_id, parent_id, waiting_since.timestamp() if waiting_since else None)
+        )
+
+    def remove_entry(self, thread_id: int) -> None:
+        """Removes the directory entry of a thread.
+
+        Parameters
+        ----------
+        thread_id: :class:`int`
+            The ID of the thread."""
+        self.connection.execute("DELETE FROM directory_entries WHERE thread_id = ?", (thread_id,))
+
+    def load_pages(self, guild_id: int) -> list[int]:
+        """Loads the message IDs of the additional directory pages of a guild.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+
+        Returns
+        -------
+        list[:class:`int`]
+            The message IDs of every page after the first one, in order."""
+        return [message_id for message_id, in self.connection.execute(
+            "SELECT message_id FROM directory_pages WHERE guild_id = ? ORDER BY page", (guild_id,)
+        )]
+
+    def set_pages(self, guild_id: int, message_ids: list[int]) -> None:
+        """Sets the message IDs of the additional directory pages of a guild.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        message_ids: list[:class:`int`]
+            The message IDs of every page after the first one, in order."""
+        self.connection.execute("DELETE FROM directory_pages WHERE guild_id = ?", (guild_id,))
+        self.connection.executemany(
+            "INSERT INTO directory_pages (guild_id, page, message_id) VALUES (?, ?, ?)",
+            [(guild_id, page, message_id) for page, message_id in enumerate(message_ids, start=1)]
+        )
+
+    def mark_migrated(self, guild_id: int) -> None:
+        """Marks the directory of a guild as migrated to the store.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild."""
+        self.connection.execute("INSERT OR IGNORE INTO migrated_guilds (guild_id) VALUES (?)", (guild_id,))
+
+
+def to_datetime(timestamp: float | None) -> datetime.datetime | None:
+    """Converts a stored UNIX timestamp to an aware datetime.
+
+    Parameters
+    ----------
+    timestamp: Optional[:class:`float`]
+        The timestamp to convert."""
+    if timestamp is None:
+        return None
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
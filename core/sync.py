@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+
+import discord
+
+__all__ = (
+    "CommandSyncCache",
+    "get_command_digest",
+)
+
+
+def get_command_digest(commands: list[discord.ApplicationCommand]) -> str:
+    """Gets a digest of the registration payloads of commands, independent of their order.
+
+    Parameters
+    ----------
+    commands: list[:class:`discord.ApplicationCommand`]
+        The commands of one scope.
+
+    Returns
+    -------
+    :class:`str`
+        The digest."""
+    payloads = sorted(json.dumps(command.to_dict(), sort_keys=True, default=str) for command in commands)
+    return hashlib.sha256("\n".join(payloads).encode()).hexdigest()
+
+
+class CommandSyncCache:
+    """Cached registration state of the application commands, per scope.
+
+    A scope is the ID of the application followed by ``global`` or the ID of a guild. For every scope, the cache
+    keeps the digest of the commands that were last registered, the IDs Discord assigned to them and the cost of that
+    sync. While the digest of the local commands matches, the commands are known to be registered and syncing the
+    scope can be skipped."""
+
+    def __init__(self, path: str) -> None:
+        """Initialises a new command sync cache.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the cache file."""
+        self.path: str = path
+        self.scopes: dict[str, dict] = {}
+        self.skipped: int = 0
+        self.pushed: int = 0
+        self.saved_calls: int = 0
+        self.saved_seconds: float = 0.0
+        self.load()
+
+    def load(self) -> None:
+        """Loads the cache file, starting with an empty cache if it can't be read."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                self.scopes = json.load(file)
+        except FileNotFoundError:
+            self.scopes = {}
+        except (OSError, ValueError) as error:
+            print(f"Failed to load the command sync cache from {self.path}: {error}")
+            self.scopes = {}
+
+    def save(self) -> None:
+        """Writes the cache file, replacing it at once so a crash never leaves a partial file behind."""
+        temporary_path = f"{self.path}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(self.scopes, file)
+            os.replace(temporary_path, self.path)
+        except OSError as error:
+            print(f"Failed to save the command sync cache to {self.path}: {error}")
+
+    def get(self, scope: str, digest: str) -> list[dict] | None:
+        """Gets the registered commands of a scope if they are up to date, counting the saved sync.
+
+        Parameters
+        ----------
+        scope: :class:`str`
+            The scope.
+        digest: :class:`str`
+            The digest of the local commands of the scope.
+
+        Returns
+        -------
+        Optional[list[:class:`dict`]]
+            The ID, name, type and guild ID of every registered command, or ``None`` if the scope has to be synced."""
+        entry = self.scopes.get(scope)
+        if entry is None or entry["digest"] != digest:
+            return None
+        self.skipped += 1
+        self.saved_calls += entry["calls"]
+        self.saved_seconds += entry["seconds"]
+        return entry["commands"]
+
+    def put(self, scope: str, digest: str, registered: list[dict], *, calls: int, seconds: float) -> None:
+        """Records the sync of a scope and saves the cache.
+
+        Parameters
+        ----------
+        scope: :class:`str`
+            The scope.
+        digest: :class:`str`
+            The digest of the synced commands.
+        registered: list[:class:`dict`]
+            The commands as returned by Discord.
+        calls: :class:`int`
+            The number of API calls the sync made.
+        seconds: :class:`float`
+            How long the sync took."""
+        self.pushed += 1
+        self.scopes[scope] = {
+            "digest": digest,
+            "commands": [
+                {key: command[key] for key in ("id", "name", "type", "guild_id") if key in command}
+                for command in registered
+            ],
+            "calls": calls,
+            "seconds": seconds
+        }
+        self.save()
+
+    def format_summary(self) -> str:
+        """Formats the result of the last sync for the console."""
+        return (f"Command sync: {self.skipped} scopes up to date, {self.pushed} synced, saved {self.saved_calls} "
+                f"API calls and {self.saved_seconds * 1000:.0f} ms")
+
+    def reset_stats(self) -> None:
+        """Resets the counters before a sync."""
+        self.skipped = self.pushed = self.saved_calls = 0
+        self.saved_seconds = 0.0
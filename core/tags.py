@@ -0,0 +1,213 @@
+import collections
+import difflib
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass
+
+import discord
+
+import core
+
+__all__ = (
+    "Tag",
+    "TagIndex",
+    "tag_store",
+    "TagStore",
+)
+
+
+@dataclass(frozen=True)
+class Tag:
+    """Represents a tag with its pre-rendered embed.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the tag.
+    content: :class:`str`
+        The raw content of the tag.
+    embed: :class:`discord.Embed`
+        The embed of the tag, with the first ``.png`` line of the content split off as its image. Has to be copied
+        before it is modified."""
+    name: str
+    content: str
+    embed: discord.Embed
+
+    @classmethod
+    def from_content(cls, name: str, content: str) -> "Tag":
+        """Creates a tag and renders its embed.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the tag.
+        content: :class:`str`
+            The raw content of the tag."""
+        description = content
+        image_url: str | None = None
+        for line in content.split("\r\n"):
+            if line.endswith(".png"):
+                image_url = line
+                description = content.replace(line, "").strip()
+                break
+        embed = discord.Embed(title=name, description=description or None, color=discord.Color.green())
+        if image_url:
+            embed.set_image(url=image_url)
+        return cls(name=name, content=content, embed=embed)
+
+    def render(self) -> discord.Embed:
+        """Gets a copy of the embed of the tag with the current timestamp."""
+        embed = self.embed.copy()
+        embed.timestamp = discord.utils.utcnow()
+        return embed
+
+
+class TagIndex:
+    """Prefix trie over the words of the tag names.
+
+    Every word of a name is inserted with the rest of the name, so ``"hous"`` completes both ``Housing`` and
+    ``Kuee Housing``. Every node keeps the names below it sorted, so completing a prefix is a walk down the trie."""
+
+    def __init__(self, names: list[str]) -> None:
+        """Builds a new index.
+
+        Parameters
+        ----------
+        names: list[:class:`str`]
+            The names of the tags."""
+        self.names: list[str] = sorted(names, key=str.casefold)
+        self._root: dict = {}
+        for name in self.names:
+            words = name.casefold().split()
+            for i in range(len(words)):
+                node = self._root
+                for char in " ".join(words[i:]):
+                    node = node.setdefault(char, {})
+                    matches = node.setdefault(None, [])
+                    if name not in matches:
+                        matches.append(name)
+        self._casefolded: dict[str, str] = {name.casefold(): name for name in self.names}
+
+    def complete(self, query: str, *, limit: int = 25) -> list[str]:
+        """Completes a query to tag names.
+
+        Names starting with the query come first, followed by names with a word starting with the query. Without
+        any prefix match, falls back to the names closest to the query.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The query to complete.
+        limit: :class:`int`
+            The maximum number of names to return.
+
+        Returns
+        -------
+        list[:class:`str`]
+            The completed names."""
+        query = " ".join(query.casefold().split())
+        if not query:
+            return self.names[:limit]
+        node = self._root
+        for char in query:
+            node = node.get(char)
+            if node is None:
+                return self.fuzzy(query, limit=limit)
+        matches = node[None]
+        return sorted(matches, key=lambda name: not name.casefold().startswith(query))[:limit]
+
+    def fuzzy(self, query: str, *, limit: int = 25) -> list[str]:
+        """Gets the names closest to a query.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The casefolded query.
+        limit: :class:`int`
+            The maximum number of names to return."""
+        matches = difflib.get_close_matches(query, self._casefolded, n=limit, cutoff=0.5)
+        return [self._casefolded[match] for match in matches]
+
+
+class TagStore:
+    """Tags loaded from a JSON file mapping tag names to their contents.
+
+    The file is loaded once and the embeds of all tags are rendered up front. The store reloads the file when it
+    changes on disk, so tags can be edited without a restart."""
+
+    def __init__(self, path: str) -> None:
+        """Initialises a new tag store.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the tag file."""
+        self.path: str = path
+        self.tags: dict[str, Tag] = {}
+        self.index: TagIndex = TagIndex([])
+        self.autocomplete_timings: collections.deque[float] = collections.deque(maxlen=1000)
+        self._mtime: float | None = None
+
+    def load(self) -> None:
+        """Loads the tags from the file and rebuilds the index."""
+        self._mtime = os.stat(self.path).st_mtime
+        with open(self.path, encoding="utf-8") as file:
+            contents: dict[str, str] = json.load(file)
+        self.tags = {name: Tag.from_content(name, content) for name, content in contents.items()}
+        self.index = TagIndex(list(self.tags))
+        print(f"Loaded {len(self.tags)} tags from {self.path}")
+
+    def reload_if_changed(self) -> None:
+        """Loads the tags if the file changed since it was last loaded.
+
+        A file that can't be read or parsed is reported once and the previous tags are kept."""
+        try:
+            if os.stat(self.path).st_mtime != self._mtime:
+                self.load()
+        except (OSError, ValueError) as error:
+            print(f"Failed to load tags from {self.path}: {error}")
+
+    def get(self, name: str) -> Tag | None:
+        """Gets a tag by its name.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the tag.
+
+        Returns
+        -------
+        Optional[:class:`Tag`]
+            The tag, or ``None`` if it doesn't exist."""
+        self.reload_if_changed()
+        return self.tags.get(name)
+
+    async def autocomplete(self, ctx: discord.AutocompleteContext) -> list[str]:
+        """Autocompletes the tag option of the tag command, recording how long it took.
+
+        Parameters
+        ----------
+        ctx: :class:`discord.AutocompleteContext`
+            The autocomplete context."""
+        start = time.perf_counter()
+        self.reload_if_changed()
+        names = self.index.complete(ctx.value or "")
+        self.autocomplete_timings.append(time.perf_counter() - start)
+        return names
+
+    def get_autocomplete_latency(self) -> tuple[float, float] | None:
+        """Gets the median and 95th percentile of the recent autocomplete latencies, in milliseconds.
+
+        Returns
+        -------
+        Optional[tuple[:class:`float`, :class:`float`]]
+            The latencies, or ``None`` if nothing has been autocompleted yet."""
+        if len(self.autocomplete_timings) < 2:
+            return None
+        quantiles = statistics.quantiles(self.autocomplete_timings, n=20)
+        return statistics.median(self.autocomplete_timings) * 1000, quantiles[-1] * 1000
+
+
+tag_store = TagStore(core.config.tags_path)